@@ -34,6 +34,7 @@ static int32_t FNV1_PRIME = 0x01000193;
 
 PyObject* hashcode(PyObject* self, PyObject *args);
 PyObject* schema_id(PyObject* self, PyObject *args);
+PyObject* entity_id(PyObject* self, PyObject *data);
 
 PyObject* str_hashcode(PyObject* data);
 int32_t str_hashcode_(PyObject* data, int lower);
@@ -42,6 +43,7 @@ PyObject* b_hashcode(PyObject* data);
 static PyMethodDef methods[] = {
     {"hashcode", (PyCFunction) hashcode, METH_VARARGS, ""},
     {"schema_id", (PyCFunction) schema_id, METH_VARARGS, ""},
+    {"entity_id", (PyCFunction) entity_id, METH_O, ""},
     {NULL, NULL, 0, NULL}       /* Sentinel */
 };
 
@@ -60,6 +62,7 @@ static struct PyModuleDef moduledef = {
 static char* hashcode_input_err = "supported only strings, bytearrays, bytes and memoryview";
 static char* schema_id_input_err = "input argument must be dict or int";
 static char* schema_field_type_err = "schema keys must be strings";
+static char* entity_id_input_err = "input argument must be str, int or None";
 
 PyMODINIT_FUNC PyInit__cutils(void) {
 	return PyModule_Create(&moduledef);
@@ -191,3 +194,33 @@ PyObject* schema_id(PyObject* self, PyObject *args) {
         return NULL;
     }
 }
+
+PyObject* entity_id(PyObject* self, PyObject *data) {
+    if (data == Py_None) {
+        Py_RETURN_NONE;
+    }
+    else if (PyLong_CheckExact(data)) {
+        Py_INCREF(data);
+        return data;
+    }
+    else if (PyUnicode_Check(data)) {
+        PyObject* lower = PyObject_CallMethod(data, "lower", NULL);
+        if (!lower) {
+            return NULL;
+        }
+
+        if (!PyUnicode_Check(lower)) {
+            Py_DECREF(lower);
+            PyErr_SetString(PyExc_ValueError, entity_id_input_err);
+            return NULL;
+        }
+
+        int32_t res = str_hashcode_(lower, 0);
+        Py_DECREF(lower);
+        return PyLong_FromLong(res);
+    }
+    else {
+        PyErr_SetString(PyExc_ValueError, entity_id_input_err);
+        return NULL;
+    }
+}
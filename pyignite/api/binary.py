@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import copy
 from typing import Union
 
 from pyignite.connection import Connection, AioConnection
@@ -25,6 +26,39 @@ from pyignite.utils import entity_id, schema_id
 from .result import APIResult
 from ..queries.response import BinaryTypeResponse
 
+_get_binary_type_query = Query(
+    OP_GET_BINARY_TYPE,
+    [
+        ('type_id', Int),
+    ],
+    response_type=BinaryTypeResponse
+)
+
+_put_binary_type_query = Query(
+    OP_PUT_BINARY_TYPE,
+    [
+        ('type_id', Int),
+        ('type_name', String),
+        ('affinity_key_field', String),
+        ('binary_fields', binary_fields_struct),
+        ('is_enum', Bool),
+        ('schema', schema_struct),
+    ]
+)
+
+_put_binary_enum_query = Query(
+    OP_PUT_BINARY_TYPE,
+    [
+        ('type_id', Int),
+        ('type_name', String),
+        ('affinity_key_field', String),
+        ('binary_fields', binary_fields_struct),
+        ('is_enum', Bool),
+        ('enums', enum_struct),
+        ('schema', schema_struct),
+    ]
+)
+
 
 def get_binary_type(conn: 'Connection', binary_type: Union[str, int], query_id=None) -> APIResult:
     """
@@ -48,18 +82,8 @@ async def get_binary_type_async(conn: 'AioConnection', binary_type: Union[str, i
 
 
 def __get_binary_type(conn, binary_type, query_id):
-    query_struct = Query(
-        OP_GET_BINARY_TYPE,
-        [
-            ('type_id', Int),
-        ],
-        query_id=query_id,
-        response_type=BinaryTypeResponse
-    )
-
-    return query_perform(query_struct, conn, query_params={
-        'type_id': entity_id(binary_type),
-    })
+    return query_perform(_get_binary_type_query.with_query_id(query_id), conn,
+                         query_params=(entity_id(binary_type),))
 
 
 def put_binary_type(connection: 'Connection', type_name: str, affinity_key_field: str = None,
@@ -92,22 +116,37 @@ async def put_binary_type_async(connection: 'AioConnection', type_name: str, aff
     return await __put_binary_type(connection, type_name, affinity_key_field, is_enum, schema, query_id)
 
 
-def __post_process_put_binary(type_id):
+def __post_process_put_binary(connection, registration, type_id, s_id):
     def internal(result):
         if result.status == 0:
             result.value = {
                 'type_id': type_id,
-                'schema_id': schema_id,
+                'schema_id': s_id,
             }
+            connection._registered_types[registration] = result
         return result
     return internal
 
 
+def __registered_binary_type(connection, registered):
+    # every caller gets its own result object
+    result = copy(registered)
+    result.value = dict(registered.value)
+
+    async def _async_internal():
+        return result
+
+    if isinstance(connection, AioConnection):
+        return _async_internal()
+    return result
+
+
 def __put_binary_type(connection, type_name, affinity_key_field, is_enum, schema, query_id):
     # prepare data
     if schema is None:
         schema = {}
     type_id = entity_id(type_name)
+    field_ids = {field_name: entity_id(field_name) for field_name in schema}
     data = {
         'type_name': type_name,
         'type_id': type_id,
@@ -129,7 +168,7 @@ def __put_binary_type(connection, type_name, affinity_key_field, is_enum, schema
         s_id = schema_id(schema)
         for field_name, data_type in schema.items():
             # TODO: check for allowed data types
-            field_id = entity_id(field_name)
+            field_id = field_ids[field_name]
             data['binary_fields'].append({
                 'field_name': field_name,
                 'type_id': int.from_bytes(
@@ -139,40 +178,23 @@ def __put_binary_type(connection, type_name, affinity_key_field, is_enum, schema
                 'field_id': field_id,
             })
 
+    # the type is already known to the node this connection is bound to
+    registration = (
+        type_name, affinity_key_field, is_enum,
+        tuple(schema.items()) if is_enum else tuple((f['field_name'], f['type_id']) for f in data['binary_fields'])
+    )
+    registered = connection._registered_types.get(registration)
+    if registered is not None:
+        return __registered_binary_type(connection, registered)
+
     data['schema'].append({
         'schema_id': s_id,
         'schema_fields': [
-            {'schema_field_id': entity_id(x)} for x in schema
+            {'schema_field_id': field_ids[x]} for x in schema
         ],
     })
 
     # do query
-    if is_enum:
-        query_struct = Query(
-            OP_PUT_BINARY_TYPE,
-            [
-                ('type_id', Int),
-                ('type_name', String),
-                ('affinity_key_field', String),
-                ('binary_fields', binary_fields_struct),
-                ('is_enum', Bool),
-                ('enums', enum_struct),
-                ('schema', schema_struct),
-            ],
-            query_id=query_id,
-        )
-    else:
-        query_struct = Query(
-            OP_PUT_BINARY_TYPE,
-            [
-                ('type_id', Int),
-                ('type_name', String),
-                ('affinity_key_field', String),
-                ('binary_fields', binary_fields_struct),
-                ('is_enum', Bool),
-                ('schema', schema_struct),
-            ],
-            query_id=query_id,
-        )
-    return query_perform(query_struct, connection, query_params=data,
-                         post_process_fun=__post_process_put_binary(type_id))
+    query_struct = _put_binary_enum_query if is_enum else _put_binary_type_query
+    return query_perform(query_struct.with_query_id(query_id), connection, query_params=data,
+                         post_process_fun=__post_process_put_binary(connection, registration, type_id, s_id))
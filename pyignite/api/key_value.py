@@ -30,6 +30,190 @@ from pyignite.queries import Query, query_perform
 from .result import APIResult
 from ..queries.query import CacheInfo
 
+_cache_put_query = Query(
+    OP_CACHE_PUT,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('value', AnyDataObject),
+    ]
+)
+
+_cache_get_query = Query(
+    OP_CACHE_GET,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+    ]
+)
+
+_cache_get_all_query = Query(
+    OP_CACHE_GET_ALL,
+    [
+        ('cache_info', CacheInfo),
+        ('keys', AnyDataArray()),
+    ]
+)
+
+_cache_put_all_query = Query(
+    OP_CACHE_PUT_ALL,
+    [
+        ('cache_info', CacheInfo),
+        ('data', Map),
+    ]
+)
+
+_cache_contains_key_query = Query(
+    OP_CACHE_CONTAINS_KEY,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+    ]
+)
+
+_cache_contains_keys_query = Query(
+    OP_CACHE_CONTAINS_KEYS,
+    [
+        ('cache_info', CacheInfo),
+        ('keys', AnyDataArray()),
+    ]
+)
+
+_cache_get_and_put_query = Query(
+    OP_CACHE_GET_AND_PUT,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('value', AnyDataObject),
+    ]
+)
+
+_cache_get_and_replace_query = Query(
+    OP_CACHE_GET_AND_REPLACE,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('value', AnyDataObject),
+    ]
+)
+
+_cache_get_and_remove_query = Query(
+    OP_CACHE_GET_AND_REMOVE,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+    ]
+)
+
+_cache_put_if_absent_query = Query(
+    OP_CACHE_PUT_IF_ABSENT,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('value', AnyDataObject),
+    ]
+)
+
+_cache_get_and_put_if_absent_query = Query(
+    OP_CACHE_GET_AND_PUT_IF_ABSENT,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('value', AnyDataObject),
+    ]
+)
+
+_cache_replace_query = Query(
+    OP_CACHE_REPLACE,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('value', AnyDataObject),
+    ]
+)
+
+_cache_replace_if_equals_query = Query(
+    OP_CACHE_REPLACE_IF_EQUALS,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('sample', AnyDataObject),
+        ('value', AnyDataObject),
+    ]
+)
+
+_cache_clear_query = Query(
+    OP_CACHE_CLEAR,
+    [
+        ('cache_info', CacheInfo),
+    ]
+)
+
+_cache_clear_key_query = Query(
+    OP_CACHE_CLEAR_KEY,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+    ]
+)
+
+_cache_clear_keys_query = Query(
+    OP_CACHE_CLEAR_KEYS,
+    [
+        ('cache_info', CacheInfo),
+        ('keys', AnyDataArray()),
+    ]
+)
+
+_cache_remove_key_query = Query(
+    OP_CACHE_REMOVE_KEY,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+    ]
+)
+
+_cache_remove_if_equals_query = Query(
+    OP_CACHE_REMOVE_IF_EQUALS,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('sample', AnyDataObject),
+    ]
+)
+
+_cache_remove_keys_query = Query(
+    OP_CACHE_REMOVE_KEYS,
+    [
+        ('cache_info', CacheInfo),
+        ('keys', AnyDataArray()),
+    ]
+)
+
+_cache_remove_all_query = Query(
+    OP_CACHE_REMOVE_ALL,
+    [
+        ('cache_info', CacheInfo),
+    ]
+)
+
+_cache_get_size_query = Query(
+    OP_CACHE_GET_SIZE,
+    [
+        ('cache_info', CacheInfo),
+        ('peek_modes', ByteArray),
+    ]
+)
+
+_cache_local_peek_query = Query(
+    OP_CACHE_LOCAL_PEEK,
+    [
+        ('cache_info', CacheInfo),
+        ('key', AnyDataObject),
+        ('peek_modes', ByteArray),
+    ]
+)
+
 
 def cache_put(connection: 'Connection', cache_info: CacheInfo, key: Any, value: Any,
               key_hint: 'IgniteDataType' = None, value_hint: 'IgniteDataType' = None,
@@ -64,22 +248,10 @@ async def cache_put_async(connection: 'AioConnection', cache_info: CacheInfo, ke
 
 
 def __cache_put(connection, cache_info, key, value, key_hint, value_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_PUT,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('value', value_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_put_query.with_hints(key=key_hint, value=value_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'value': value
-        }
+        query_params=(cache_info, key, value)
     )
 
 
@@ -111,20 +283,10 @@ async def cache_get_async(connection: 'AioConnection', cache_info: CacheInfo, ke
 
 
 def __cache_get(connection, cache_info, key, key_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_GET,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_get_query.with_hints(key=key_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-        },
+        query_params=(cache_info, key),
         response_config=[
             ('value', AnyDataObject),
         ],
@@ -159,20 +321,10 @@ async def cache_get_all_async(connection: 'AioConnection', cache_info: CacheInfo
 
 
 def __cache_get_all(connection, cache_info, keys, query_id):
-    query_struct = Query(
-        OP_CACHE_GET_ALL,
-        [
-            ('cache_info', CacheInfo),
-            ('keys', AnyDataArray()),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_get_all_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'keys': keys,
-        },
+        query_params=(cache_info, keys),
         response_config=[
             ('data', Map),
         ],
@@ -209,20 +361,10 @@ async def cache_put_all_async(connection: 'AioConnection', cache_info: CacheInfo
 
 
 def __cache_put_all(connection, cache_info, pairs, query_id):
-    query_struct = Query(
-        OP_CACHE_PUT_ALL,
-        [
-            ('cache_info', CacheInfo),
-            ('data', Map),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_put_all_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'data': pairs,
-        },
+        query_params=(cache_info, pairs),
     )
 
 
@@ -255,20 +397,10 @@ async def cache_contains_key_async(connection: 'AioConnection', cache_info: Cach
 
 
 def __cache_contains_key(connection, cache_info, key, key_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_CONTAINS_KEY,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_contains_key_query.with_hints(key=key_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-        },
+        query_params=(cache_info, key),
         response_config=[
             ('value', Bool),
         ],
@@ -303,20 +435,10 @@ async def cache_contains_keys_async(connection: 'AioConnection', cache_info: Cac
 
 
 def __cache_contains_keys(connection, cache_info, keys, query_id):
-    query_struct = Query(
-        OP_CACHE_CONTAINS_KEYS,
-        [
-            ('cache_info', CacheInfo),
-            ('keys', AnyDataArray()),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_contains_keys_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'keys': keys,
-        },
+        query_params=(cache_info, keys),
         response_config=[
             ('value', Bool),
         ],
@@ -359,22 +481,10 @@ async def cache_get_and_put_async(connection: 'AioConnection', cache_info: Cache
 
 
 def __cache_get_and_put(connection, cache_info, key, value, key_hint, value_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_GET_AND_PUT,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('value', value_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_get_and_put_query.with_hints(key=key_hint, value=value_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'value': value,
-        },
+        query_params=(cache_info, key, value),
         response_config=[
             ('value', AnyDataObject),
         ],
@@ -417,21 +527,10 @@ async def cache_get_and_replace_async(connection: 'AioConnection', cache_info: C
 
 
 def __cache_get_and_replace(connection, cache_info, key, key_hint, value, value_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_GET_AND_REPLACE, [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('value', value_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_get_and_replace_query.with_hints(key=key_hint, value=value_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'value': value,
-        },
+        query_params=(cache_info, key, value),
         response_config=[
             ('value', AnyDataObject),
         ],
@@ -465,19 +564,10 @@ async def cache_get_and_remove_async(
 
 
 def __cache_get_and_remove(connection, cache_info, key, key_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_GET_AND_REMOVE, [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_get_and_remove_query.with_hints(key=key_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-        },
+        query_params=(cache_info, key),
         response_config=[
             ('value', AnyDataObject),
         ],
@@ -519,22 +609,10 @@ async def cache_put_if_absent_async(connection: 'AioConnection', cache_info: Cac
 
 
 def __cache_put_if_absent(connection, cache_info, key, value, key_hint, value_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_PUT_IF_ABSENT,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('value', value_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_put_if_absent_query.with_hints(key=key_hint, value=value_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'value': value,
-        },
+        query_params=(cache_info, key, value),
         response_config=[
             ('success', Bool),
         ],
@@ -576,22 +654,10 @@ async def cache_get_and_put_if_absent_async(connection: 'AioConnection', cache_i
 
 
 def __cache_get_and_put_if_absent(connection, cache_info, key, value, key_hint, value_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_GET_AND_PUT_IF_ABSENT,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('value', value_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_get_and_put_if_absent_query.with_hints(key=key_hint, value=value_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'value': value,
-        },
+        query_params=(cache_info, key, value),
         response_config=[
             ('value', AnyDataObject),
         ],
@@ -633,22 +699,10 @@ async def cache_replace_async(connection: 'AioConnection', cache_info: CacheInfo
 
 
 def __cache_replace(connection, cache_info, key, value, key_hint, value_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_REPLACE,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('value', value_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_replace_query.with_hints(key=key_hint, value=value_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'value': value,
-        },
+        query_params=(cache_info, key, value),
         response_config=[
             ('success', Bool),
         ],
@@ -697,24 +751,12 @@ async def cache_replace_if_equals_async(
 
 
 def __cache_replace_if_equals(connection, cache_info, key, sample, value, key_hint, sample_hint, value_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_REPLACE_IF_EQUALS,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('sample', sample_hint or AnyDataObject),
-            ('value', value_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_replace_if_equals_query.with_hints(
+        key=key_hint, sample=sample_hint, value=value_hint
+    ).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'sample': sample,
-            'value': value,
-        },
+        query_params=(cache_info, key, sample, value),
         response_config=[
             ('success', Bool),
         ],
@@ -746,18 +788,10 @@ async def cache_clear_async(
 
 
 def __cache_clear(connection, cache_info, query_id):
-    query_struct = Query(
-        OP_CACHE_CLEAR,
-        [
-            ('cache_info', CacheInfo),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_clear_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-        },
+        query_params=(cache_info,),
     )
 
 
@@ -789,20 +823,10 @@ async def cache_clear_key_async(connection: 'AioConnection', cache_info: CacheIn
 
 
 def __cache_clear_key(connection, cache_info, key, key_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_CLEAR_KEY,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_clear_key_query.with_hints(key=key_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-        },
+        query_params=(cache_info, key),
     )
 
 
@@ -833,20 +857,10 @@ async def cache_clear_keys_async(
 
 
 def __cache_clear_keys(connection, cache_info, keys, query_id):
-    query_struct = Query(
-        OP_CACHE_CLEAR_KEYS,
-        [
-            ('cache_info', CacheInfo),
-            ('keys', AnyDataArray()),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_clear_keys_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'keys': keys,
-        },
+        query_params=(cache_info, keys),
     )
 
 
@@ -879,20 +893,10 @@ async def cache_remove_key_async(connection: 'AioConnection', cache_info: CacheI
 
 
 def __cache_remove_key(connection, cache_info, key, key_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_REMOVE_KEY,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_remove_key_query.with_hints(key=key_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-        },
+        query_params=(cache_info, key),
         response_config=[
             ('success', Bool),
         ],
@@ -935,22 +939,10 @@ async def cache_remove_if_equals_async(
 
 
 def __cache_remove_if_equals(connection, cache_info, key, sample, key_hint, sample_hint, query_id):
-    query_struct = Query(
-        OP_CACHE_REMOVE_IF_EQUALS,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('sample', sample_hint or AnyDataObject),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_remove_if_equals_query.with_hints(key=key_hint, sample=sample_hint).with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'sample': sample,
-        },
+        query_params=(cache_info, key, sample),
         response_config=[
             ('success', Bool),
         ],
@@ -985,20 +977,10 @@ async def cache_remove_keys_async(
 
 
 def __cache_remove_keys(connection, cache_info, keys, query_id):
-    query_struct = Query(
-        OP_CACHE_REMOVE_KEYS,
-        [
-            ('cache_info', CacheInfo),
-            ('keys', AnyDataArray()),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_remove_keys_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'keys': keys,
-        },
+        query_params=(cache_info, keys),
     )
 
 
@@ -1026,18 +1008,10 @@ async def cache_remove_all_async(
 
 
 def __cache_remove_all(connection, cache_info, query_id):
-    query_struct = Query(
-        OP_CACHE_REMOVE_ALL,
-        [
-            ('cache_info', CacheInfo),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_remove_all_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-        },
+        query_params=(cache_info,),
     )
 
 
@@ -1074,20 +1048,10 @@ def __cache_get_size(connection, cache_info, peek_modes, query_id):
     elif not isinstance(peek_modes, (list, tuple)):
         peek_modes = [peek_modes]
 
-    query_struct = Query(
-        OP_CACHE_GET_SIZE,
-        [
-            ('cache_info', CacheInfo),
-            ('peek_modes', ByteArray),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_get_size_query.with_query_id(query_id)
     return query_perform(
         query_struct, connection,
-        query_params={
-            'cache_info': cache_info,
-            'peek_modes': peek_modes,
-        },
+        query_params=(cache_info, peek_modes),
         response_config=[
             ('count', Long),
         ],
@@ -1136,22 +1100,10 @@ def __cache_local_peek(conn, cache_info, key, key_hint, peek_modes, query_id):
     elif not isinstance(peek_modes, (list, tuple)):
         peek_modes = [peek_modes]
 
-    query_struct = Query(
-        OP_CACHE_LOCAL_PEEK,
-        [
-            ('cache_info', CacheInfo),
-            ('key', key_hint or AnyDataObject),
-            ('peek_modes', ByteArray),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _cache_local_peek_query.with_hints(key=key_hint).with_query_id(query_id)
     return query_perform(
         query_struct, conn,
-        query_params={
-            'cache_info': cache_info,
-            'key': key,
-            'peek_modes': peek_modes,
-        },
+        query_params=(cache_info, key, peek_modes),
         response_config=[
             ('value', AnyDataObject),
         ],
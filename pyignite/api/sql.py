@@ -13,6 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+from functools import lru_cache
+from operator import itemgetter
+
 from pyignite.connection import AioConnection, Connection
 from pyignite.datatypes import AnyDataArray, AnyDataObject, Bool, Int, Long, Map, Null, String, StructArray
 from pyignite.datatypes.sql import StatementType
@@ -26,6 +30,82 @@ from .result import APIResult
 from ..queries.query import CacheInfo
 from ..queries.response import SQLResponse
 
+_scan_query = Query(
+    OP_QUERY_SCAN,
+    [
+        ('cache_info', CacheInfo),
+        ('filter', Null),
+        ('page_size', Int),
+        ('partitions', Int),
+        ('local', Bool),
+    ]
+)
+
+_scan_cursor_get_page_query = Query(
+    OP_QUERY_SCAN_CURSOR_GET_PAGE,
+    [
+        ('cursor', Long),
+    ]
+)
+
+_sql_query = Query(
+    OP_QUERY_SQL,
+    [
+        ('cache_info', CacheInfo),
+        ('table_name', String),
+        ('query_str', String),
+        ('query_args', AnyDataArray()),
+        ('distributed_joins', Bool),
+        ('local', Bool),
+        ('replicated_only', Bool),
+        ('page_size', Int),
+        ('timeout', Long),
+    ]
+)
+
+_sql_cursor_get_page_query = Query(
+    OP_QUERY_SQL_CURSOR_GET_PAGE,
+    [
+        ('cursor', Long),
+    ]
+)
+
+_sql_fields_query = Query(
+    OP_QUERY_SQL_FIELDS,
+    [
+        ('cache_info', CacheInfo),
+        ('schema', String),
+        ('page_size', Int),
+        ('max_rows', Int),
+        ('query_str', String),
+        ('query_args', AnyDataArray()),
+        ('statement_type', StatementType),
+        ('distributed_joins', Bool),
+        ('local', Bool),
+        ('replicated_only', Bool),
+        ('enforce_join_order', Bool),
+        ('collocated', Bool),
+        ('lazy', Bool),
+        ('timeout', Long),
+        ('include_field_names', Bool),
+    ],
+    response_type=SQLResponse
+)
+
+_sql_fields_cursor_get_page_query = Query(
+    OP_QUERY_SQL_FIELDS_CURSOR_GET_PAGE,
+    [
+        ('cursor', Long),
+    ]
+)
+
+_resource_close_query = Query(
+    OP_RESOURCE_CLOSE,
+    [
+        ('cursor', Long),
+    ]
+)
+
 
 def scan(conn: 'Connection', cache_info: CacheInfo, page_size: int, partitions: int = -1, local: bool = False,
          query_id: int = None) -> APIResult:
@@ -71,17 +151,7 @@ def __query_result_post_process(result):
 
 
 def __scan(conn, cache_info, page_size, partitions, local, query_id):
-    query_struct = Query(
-        OP_QUERY_SCAN,
-        [
-            ('cache_info', CacheInfo),
-            ('filter', Null),
-            ('page_size', Int),
-            ('partitions', Int),
-            ('local', Bool),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _scan_query.with_query_id(query_id)
     return query_perform(
         query_struct, conn,
         query_params={
@@ -89,7 +159,7 @@ def __scan(conn, cache_info, page_size, partitions, local, query_id):
             'filter': None,
             'page_size': page_size,
             'partitions': partitions,
-            'local': 1 if local else 0,
+            'local': local,
         },
         response_config=[
             ('cursor', Long),
@@ -128,18 +198,10 @@ async def scan_cursor_get_page_async(conn: 'AioConnection', cursor: int, query_i
 
 
 def __scan_cursor_get_page(conn, cursor, query_id):
-    query_struct = Query(
-        OP_QUERY_SCAN_CURSOR_GET_PAGE,
-        [
-            ('cursor', Long),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _scan_cursor_get_page_query.with_query_id(query_id)
     return query_perform(
         query_struct, conn,
-        query_params={
-            'cursor': cursor,
-        },
+        query_params=(cursor,),
         response_config=[
             ('data', Map),
             ('more', Bool),
@@ -191,21 +253,7 @@ def sql(
     if query_args is None:
         query_args = []
 
-    query_struct = Query(
-        OP_QUERY_SQL,
-        [
-            ('cache_info', CacheInfo),
-            ('table_name', String),
-            ('query_str', String),
-            ('query_args', AnyDataArray()),
-            ('distributed_joins', Bool),
-            ('local', Bool),
-            ('replicated_only', Bool),
-            ('page_size', Int),
-            ('timeout', Long),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _sql_query.with_query_id(query_id)
     result = query_struct.perform(
         conn,
         query_params={
@@ -213,9 +261,9 @@ def sql(
             'table_name': table_name,
             'query_str': query_str,
             'query_args': query_args,
-            'distributed_joins': 1 if distributed_joins else 0,
-            'local': 1 if local else 0,
-            'replicated_only': 1 if replicated_only else 0,
+            'distributed_joins': distributed_joins,
+            'local': local,
+            'replicated_only': replicated_only,
             'page_size': page_size,
             'timeout': timeout,
         },
@@ -254,18 +302,10 @@ def sql_cursor_get_page(
        ‘sql_cursor_get_page’ calls.
     """
 
-    query_struct = Query(
-        OP_QUERY_SQL_CURSOR_GET_PAGE,
-        [
-            ('cursor', Long),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _sql_cursor_get_page_query.with_query_id(query_id)
     result = query_struct.perform(
         conn,
-        query_params={
-            'cursor': cursor,
-        },
+        query_params=(cursor,),
         response_config=[
             ('data', Map),
             ('more', Bool),
@@ -356,28 +396,7 @@ def __sql_fields(
     if query_args is None:
         query_args = []
 
-    query_struct = Query(
-        OP_QUERY_SQL_FIELDS,
-        [
-            ('cache_info', CacheInfo),
-            ('schema', String),
-            ('page_size', Int),
-            ('max_rows', Int),
-            ('query_str', String),
-            ('query_args', AnyDataArray()),
-            ('statement_type', StatementType),
-            ('distributed_joins', Bool),
-            ('local', Bool),
-            ('replicated_only', Bool),
-            ('enforce_join_order', Bool),
-            ('collocated', Bool),
-            ('lazy', Bool),
-            ('timeout', Long),
-            ('include_field_names', Bool),
-        ],
-        query_id=query_id,
-        response_type=SQLResponse
-    )
+    query_struct = _sql_fields_query.with_query_id(query_id)
 
     return query_perform(
         query_struct, conn,
@@ -434,39 +453,68 @@ async def sql_fields_cursor_get_page_async(conn: 'AioConnection', cursor: int, f
     return await __sql_fields_cursor_get_page(conn, cursor, field_count, query_id)
 
 
-def __sql_fields_cursor_get_page(conn, cursor, field_count, query_id):
-    query_struct = Query(
-        OP_QUERY_SQL_FIELDS_CURSOR_GET_PAGE,
-        [
-            ('cursor', Long),
-        ],
-        query_id=query_id,
-    )
+def _sql_fields_cursor_get_page_rows(conn: 'Connection', cursor: int, field_count: int) -> APIResult:
+    """
+    Same as `sql_fields_cursor_get_page`, but the `data` of the result
+    is an iterator, which converts the rows only when they are consumed.
+    Used by the cursors, which iterate a page only once.
+    """
+    return __sql_fields_cursor_get_page(conn, cursor, field_count, None, lazy=True)
+
+
+async def _sql_fields_cursor_get_page_rows_async(conn: 'AioConnection', cursor: int, field_count: int) -> APIResult:
+    """
+    Async version of _sql_fields_cursor_get_page_rows.
+    """
+    return await __sql_fields_cursor_get_page(conn, cursor, field_count, None, lazy=True)
+
+
+def __sql_fields_cursor_get_page(conn, cursor, field_count, query_id, lazy=False):
+    query_struct = _sql_fields_cursor_get_page_query.with_query_id(query_id)
     return query_perform(
         query_struct, conn,
-        query_params={
-            'cursor': cursor,
-        },
-        response_config=[
-            ('data', StructArray([(f'field_{i}', AnyDataObject) for i in range(field_count)])),
-            ('more', Bool),
-        ],
-        post_process_fun=__post_process_sql_fields_cursor
+        query_params=(cursor,),
+        response_config=__sql_fields_cursor_response_config(field_count),
+        post_process_fun=__post_process_sql_fields_cursor(field_count, lazy)
     )
 
 
-def __post_process_sql_fields_cursor(result):
-    if result.status != 0:
-        return result
+@lru_cache(maxsize=256)
+def __sql_fields_cursor_field_names(field_count):
+    # row dicts and the row getter share the same interned keys
+    return tuple(sys.intern(f'field_{i}') for i in range(field_count))
 
-    value = result.value
-    result.value = {
-        'data': [],
-        'more': value['more']
-    }
-    for row_dict in value['data']:
-        result.value['data'].append(list(row_dict.values()))
-    return result
+
+@lru_cache(maxsize=256)
+def __sql_fields_cursor_response_config(field_count):
+    return [
+        ('data', StructArray([(name, AnyDataObject) for name in __sql_fields_cursor_field_names(field_count)])),
+        ('more', Bool),
+    ]
+
+
+@lru_cache(maxsize=256)
+def __post_process_sql_fields_cursor(field_count, lazy):
+    get_columns = itemgetter(*__sql_fields_cursor_field_names(field_count))
+
+    if field_count == 1:
+        def get_row(row_dict):
+            return [get_columns(row_dict)]
+    else:
+        def get_row(row_dict):
+            return list(get_columns(row_dict))
+
+    def internal(result):
+        if result.status != 0:
+            return result
+
+        value = result.value
+        result.value = {
+            'data': map(get_row, value['data']) if lazy else list(map(get_row, value['data'])),
+            'more': value['more']
+        }
+        return result
+    return internal
 
 
 def resource_close(conn: 'Connection', cursor: int, query_id: int = None) -> APIResult:
@@ -489,16 +537,8 @@ async def resource_close_async(conn: 'AioConnection', cursor: int, query_id: int
 
 
 def __resource_close(conn, cursor, query_id):
-    query_struct = Query(
-        OP_RESOURCE_CLOSE,
-        [
-            ('cursor', Long),
-        ],
-        query_id=query_id,
-    )
+    query_struct = _resource_close_query.with_query_id(query_id)
     return query_perform(
         query_struct, conn,
-        query_params={
-            'cursor': cursor,
-        }
+        query_params=(cursor,)
     )
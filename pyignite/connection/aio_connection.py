@@ -95,8 +95,13 @@ class AioConnection(BaseConnection):
         """
         super().__init__(client, host, port, username, password, **ssl_params)
         self._mux = Lock()
+        # drain() can not be awaited concurrently before Python 3.10
+        self._drain_lock = Lock()
         self._reader = None
         self._writer = None
+        self._reader_task = None
+        self._send_frames = []
+        self._pending_reqs = {}
 
     @property
     def closed(self) -> bool:
@@ -137,6 +142,9 @@ class AioConnection(BaseConnection):
         self.client.protocol_context.features = features
         self.uuid = result.get('node_uuid', None)  # version-specific (1.4+)
         self.failed = False
+        self._registered_types.clear()
+        self._response_structs.clear()
+        self._reader_task = asyncio.ensure_future(self._read_responses())
         return result
 
     async def _connect_version(self) -> Union[dict, OrderedDict]:
@@ -185,70 +193,123 @@ class AioConnection(BaseConnection):
         except connection_errors:
             pass
 
-    async def request(self, data: Union[bytes, bytearray]) -> bytearray:
+    async def request(self, data: Union[bytes, bytearray]) -> bytes:
         """
-        Perform request.
+        Perform request. Concurrent requests are pipelined over the same
+        connection, responses are matched to requests by query ID.
 
         :param data: bytes to send.
         """
-        async with self._mux:
-            await self._send(data)
-            return await self._recv()
+        if self.failed:
+            # the connection was lost while idle
+            await self.reconnect()
+        if not self.alive or self._reader_task.done():
+            raise SocketError('Connection broken.' if self.failed else 'Attempt to use closed connection.')
+
+        query_id = bytes(data[6:14])
+        # query ID can be set explicitly, so wait for the request that uses it
+        while query_id in self._pending_reqs:
+            await asyncio.wait([self._pending_reqs[query_id]])
+
+        response = asyncio.get_event_loop().create_future()
+        self._pending_reqs[query_id] = response
+        try:
+            await self._send(data, reconnect=False)
+            return await response
+        except asyncio.CancelledError:
+            if self._pending_reqs.get(query_id) is response and not self.closed:
+                # the frame is sent anyway, so its late response must not reach the next request with this query ID
+                self._pending_reqs[query_id] = self.__discarded_response()
+            raise
+        except connection_errors:
+            if self.failed:
+                await self.reconnect()
+            raise
+        finally:
+            if self._pending_reqs.get(query_id) is response:
+                del self._pending_reqs[query_id]
+            if response.done() and not response.cancelled():
+                # the request may have already failed on sending
+                response.exception()
+
+    @staticmethod
+    def __discarded_response():
+        response = asyncio.get_event_loop().create_future()
+        response.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return response
 
     async def _send(self, data: Union[bytes, bytearray], reconnect=True):
         if self.closed:
             raise SocketError('Attempt to use closed connection.')
 
+        frames = self._send_frames
+        frames.append(data)
+        if len(frames) > 1:
+            # the frame goes out with the write that is already scheduled
+            return
+
+        try:
+            # let the requests issued in the same event loop iteration join the write
+            await asyncio.sleep(0)
+        finally:
+            self._send_frames = []
+            if not self.closed:
+                self._writer.write(frames[0] if len(frames) == 1 else b''.join(frames))
+
+        if self.closed:
+            raise SocketError('Attempt to use closed connection.')
+
         try:
-            self._writer.write(data)
-            await self._writer.drain()
+            async with self._drain_lock:
+                await self._writer.drain()
         except connection_errors:
             self.failed = True
             if reconnect:
                 await self._reconnect()
             raise
 
-    async def _recv(self, reconnect=True) -> bytearray:
+    async def _recv(self, reconnect=True) -> bytes:
         if self.closed:
             raise SocketError('Attempt to use closed connection.')
 
-        data = bytearray(1024)
-        buffer = memoryview(data)
-        bytes_total_received, bytes_to_receive = 0, 0
-        while True:
-            try:
-                chunk = await self._reader.read(len(buffer))
-                bytes_received = len(chunk)
-                if bytes_received == 0:
-                    raise SocketError('Connection broken.')
-
-                buffer[0:bytes_received] = chunk
-                bytes_total_received += bytes_received
-            except connection_errors:
-                self.failed = True
-                if reconnect:
-                    await self._reconnect()
-                raise
-
-            if bytes_total_received < 4:
-                continue
-            elif bytes_to_receive == 0:
-                response_len = int.from_bytes(data[0:4], PROTOCOL_BYTE_ORDER)
-                bytes_to_receive = response_len
+        try:
+            header = await self._reader.readexactly(4)
+            response_len = int.from_bytes(header, PROTOCOL_BYTE_ORDER)
+            # immutable bytes are shared by the response stream instead of being copied into it
+            data = header + await self._reader.readexactly(response_len)
+        except connection_errors as e:
+            self.failed = True
+            if reconnect:
+                await self._reconnect()
+            if isinstance(e, asyncio.IncompleteReadError):
+                raise SocketError('Connection broken.') from e
+            raise
 
-                if response_len + 4 > len(data):
-                    buffer.release()
-                    data.extend(bytearray(response_len + 4 - len(data)))
-                    buffer = memoryview(data)[bytes_total_received:]
-                    continue
+        return data
 
-            if bytes_total_received >= bytes_to_receive:
-                buffer.release()
-                break
+    async def _read_responses(self):
+        """
+        Read responses and hand them to the pending requests.
+        """
+        while True:
+            try:
+                data = await self._recv(reconnect=False)
+            except connection_errors as e:
+                self._fail_pending_requests(e)
+                # the connection is unusable, so it is closed to be reconnected on the next request
+                self._reader_task = None
+                self._close()
+                return
 
-            buffer = buffer[bytes_received:]
+            response = self._pending_reqs.pop(data[4:12], None)
+            if response is not None and not response.done():
+                response.set_result(data)
 
-        return data
+    def _fail_pending_requests(self, exc: Exception):
+        pending_reqs, self._pending_reqs = self._pending_reqs, {}
+        for response in pending_reqs.values():
+            if not response.done():
+                response.set_exception(exc)
 
     async def close(self):
         async with self._mux:
@@ -258,6 +319,12 @@ class AioConnection(BaseConnection):
         """
         Close connection.
         """
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+
+        self._fail_pending_requests(SocketError('Connection closed.'))
+
         if self._writer:
             try:
                 self._writer.close()
@@ -28,6 +28,9 @@ from ..stream import BinaryStream
 
 CLIENT_STATUS_AUTH_FAILURE = 2000
 
+# responses up to this size are received into the reusable per-connection buffer
+RECV_BUFFER_MAX_SIZE = 64 * 1024
+
 
 class BaseConnection:
     def __init__(self, client, host: str = None, port: int = None, username: str = None, password: str = None,
@@ -46,6 +49,10 @@ class BaseConnection:
 
         self.ssl_params = ssl_params
         self._failed = False
+        # results of binary type registrations made through this connection
+        self._registered_types = {}
+        # response parsers are stateless, so they are shared between the requests
+        self._response_structs = {}
 
     @property
     def closed(self) -> bool:
@@ -151,6 +158,7 @@ class Connection(BaseConnection):
         super().__init__(client, host, port, username, password, **ssl_params)
         self.timeout = timeout
         self._socket = None
+        self._recv_buffer = memoryview(bytearray(1024))
 
     @property
     def closed(self) -> bool:
@@ -189,6 +197,8 @@ class Connection(BaseConnection):
         self.client.protocol_context.features = features
         self.uuid = result.get('node_uuid', None)  # version-specific (1.4+)
         self.failed = False
+        self._registered_types.clear()
+        self._response_structs.clear()
         return result
 
     def _connect_version(self) -> Union[dict, OrderedDict]:
@@ -235,17 +245,18 @@ class Connection(BaseConnection):
         except connection_errors:
             pass
 
-    def request(self, data: Union[bytes, bytearray], flags=None) -> bytearray:
+    def request(self, data: Union[bytes, bytearray, memoryview], flags=None) -> memoryview:
         """
         Perform request.
 
         :param data: bytes to send,
-        :param flags: (optional) OS-specific flags.
+        :param flags: (optional) OS-specific flags,
+        :return: response, valid until the next request.
         """
         self.send(data, flags=flags)
         return self.recv()
 
-    def send(self, data: Union[bytes, bytearray], flags=None, reconnect=True):
+    def send(self, data: Union[bytes, bytearray, memoryview], flags=None, reconnect=True):
         """
         Send data down the socket.
 
@@ -268,12 +279,14 @@ class Connection(BaseConnection):
                 self.reconnect()
             raise
 
-    def recv(self, flags=None, reconnect=True) -> bytearray:
+    def recv(self, flags=None, reconnect=True) -> memoryview:
         """
         Receive data from the socket.
 
         :param flags: (optional) OS-specific flags.
         :param reconnect: (optional) reconnect on failure, default True.
+        :return: response, it may share the buffer with the next one,
+         so it is only valid until the next receive.
         """
         if self.closed:
             raise SocketError('Attempt to use closed connection.')
@@ -282,40 +295,40 @@ class Connection(BaseConnection):
         if flags is not None:
             kwargs['flags'] = flags
 
-        data = bytearray(1024)
-        buffer = memoryview(data)
-        bytes_total_received, bytes_to_receive = 0, 0
-        while True:
-            try:
-                bytes_received = self._socket.recv_into(buffer, len(buffer), **kwargs)
+        # responses are received into the reusable buffer, so that no buffer is allocated per response
+        buffer = self._recv_buffer
+        bytes_total_received = 0
+        try:
+            while bytes_total_received < 4:
+                bytes_received = self._socket.recv_into(
+                    buffer[bytes_total_received:], len(buffer) - bytes_total_received, **kwargs
+                )
                 if bytes_received == 0:
                     raise SocketError('Connection broken.')
                 bytes_total_received += bytes_received
-            except connection_errors:
-                self.failed = True
-                if reconnect:
-                    self.reconnect()
-                raise
-
-            if bytes_total_received < 4:
-                continue
-            elif bytes_to_receive == 0:
-                response_len = int.from_bytes(data[0:4], PROTOCOL_BYTE_ORDER)
-                bytes_to_receive = response_len
-
-                if response_len + 4 > len(data):
-                    buffer.release()
-                    data.extend(bytearray(response_len + 4 - len(data)))
-                    buffer = memoryview(data)[bytes_total_received:]
-                    continue
-
-            if bytes_total_received >= bytes_to_receive:
-                buffer.release()
-                break
-
-            buffer = buffer[bytes_received:]
-
-        return data
+
+            response_len = int.from_bytes(buffer[0:4], PROTOCOL_BYTE_ORDER) + 4
+            if response_len > len(buffer):
+                data = memoryview(bytearray(response_len))
+                data[0:bytes_total_received] = buffer[0:bytes_total_received]
+                if response_len <= RECV_BUFFER_MAX_SIZE:
+                    self._recv_buffer = data
+                buffer = data
+
+            while bytes_total_received < response_len:
+                bytes_received = self._socket.recv_into(
+                    buffer[bytes_total_received:], response_len - bytes_total_received, **kwargs
+                )
+                if bytes_received == 0:
+                    raise SocketError('Connection broken.')
+                bytes_total_received += bytes_received
+        except connection_errors:
+            self.failed = True
+            if reconnect:
+                self.reconnect()
+            raise
+
+        return buffer[0:response_len]
 
     def close(self):
         """
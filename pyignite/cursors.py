@@ -21,8 +21,9 @@ import asyncio
 
 from pyignite.api import (
     scan, scan_cursor_get_page, resource_close, scan_async, scan_cursor_get_page_async, resource_close_async, sql,
-    sql_cursor_get_page, sql_fields, sql_fields_cursor_get_page, sql_fields_cursor_get_page_async, sql_fields_async
+    sql_cursor_get_page, sql_fields, sql_fields_async
 )
+from pyignite.api.sql import _sql_fields_cursor_get_page_rows, _sql_fields_cursor_get_page_rows_async
 from pyignite.exceptions import CacheError, SQLError
 
 
@@ -317,7 +318,7 @@ class SqlFieldsCursor(AbstractSqlFieldsCursor, CursorMixin):
             row = next(self.data)
         except StopIteration:
             if self.more:
-                result = sql_fields_cursor_get_page(self.connection, self.cursor_id, self._field_count)
+                result = _sql_fields_cursor_get_page_rows(self.connection, self.cursor_id, self._field_count)
                 if result.status != 0:
                     raise SQLError(result.message)
 
@@ -333,6 +334,11 @@ class SqlFieldsCursor(AbstractSqlFieldsCursor, CursorMixin):
 class AioSqlFieldsCursor(AbstractSqlFieldsCursor, AioCursorMixin):
     """
     Asynchronous SQL fields query cursor.
+
+    The next page is requested in the background while the current one
+    is being consumed, so the cursor must be closed, either with
+    `async with` or by awaiting :py:meth:`close`, when it is not iterated
+    to the end.
     """
     def __init__(self, client, cache_info, *args, **kwargs):
         """
@@ -341,6 +347,7 @@ class AioSqlFieldsCursor(AbstractSqlFieldsCursor, AioCursorMixin):
         """
         super().__init__(client, cache_info)
         self._params = (args, kwargs)
+        self._next_page = None
 
     async def __aenter__(self):
         await self._initialize(*self._params[0], *self._params[1])
@@ -362,11 +369,12 @@ class AioSqlFieldsCursor(AbstractSqlFieldsCursor, AioCursorMixin):
             row = next(self.data)
         except StopIteration:
             if self.more:
-                result = await sql_fields_cursor_get_page_async(self.connection, self.cursor_id, self._field_count)
+                result = await self._next_page
                 if result.status != 0:
                     raise SQLError(result.message)
 
                 self.data, self.more = iter(result.value['data']), result.value['more']
+                self._prefetch_page()
                 try:
                     row = next(self.data)
                 except StopIteration:
@@ -382,3 +390,30 @@ class AioSqlFieldsCursor(AbstractSqlFieldsCursor, AioCursorMixin):
 
         self.connection = await self.client.random_node()
         self._finalize_init(await sql_fields_async(self.connection, self.cache_info, *args, **kwargs))
+        self._prefetch_page()
+
+    def _prefetch_page(self):
+        # the next page is requested while the current one is being consumed
+        self._next_page = None
+        if self.more:
+            self._next_page = asyncio.ensure_future(
+                _sql_fields_cursor_get_page_rows_async(self.connection, self.cursor_id, self._field_count)
+            )
+            # a failed page of a cursor that is never closed must not be logged as unretrieved
+            self._next_page.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    async def close(self):
+        """
+        Close cursor.
+        """
+        next_page, self._next_page = self._next_page, None
+        try:
+            if next_page and not next_page.done():
+                next_page.cancel()
+            elif next_page and not next_page.cancelled() and not next_page.exception():
+                # the server releases the cursor itself once the last page is sent
+                result = next_page.result()
+                if result.status == 0:
+                    self.more = result.value['more']
+        finally:
+            await super().close()
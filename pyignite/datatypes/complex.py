@@ -361,29 +361,26 @@ class _MapBase:
     def _to_python(cls, ctypes_object, **kwargs):
         map_cls = cls.__get_map_class(ctypes_object)
 
-        result = map_cls()
-        for i in range(0, ctypes_object.length << 1, 2):
-            k = AnyDataObject.to_python(getattr(ctypes_object, f'element_{i}'), **kwargs)
-            v = AnyDataObject.to_python(getattr(ctypes_object, f'element_{i + 1}'), **kwargs)
-            result[k] = v
-        return result
+        elements_count = ctypes_object.length << 1
+        keys = [
+            AnyDataObject.to_python(getattr(ctypes_object, f'element_{i}'), **kwargs)
+            for i in range(0, elements_count, 2)
+        ]
+        values = [
+            AnyDataObject.to_python(getattr(ctypes_object, f'element_{i}'), **kwargs)
+            for i in range(1, elements_count, 2)
+        ]
+        return map_cls(zip(keys, values))
 
     @classmethod
     async def _to_python_async(cls, ctypes_object, **kwargs):
         map_cls = cls.__get_map_class(ctypes_object)
 
-        kv_pairs_coro = [
-            asyncio.gather(
-                AnyDataObject.to_python_async(
-                    getattr(ctypes_object, f'element_{i}'), **kwargs
-                ),
-                AnyDataObject.to_python_async(
-                    getattr(ctypes_object, f'element_{i + 1}'), **kwargs
-                )
-            ) for i in range(0, ctypes_object.length << 1, 2)
-        ]
-
-        return map_cls(await asyncio.gather(*kv_pairs_coro))
+        elements = await asyncio.gather(*[
+            AnyDataObject.to_python_async(getattr(ctypes_object, f'element_{i}'), **kwargs)
+            for i in range(ctypes_object.length << 1)
+        ])
+        return map_cls(zip(elements[::2], elements[1::2]))
 
     @classmethod
     def __get_map_class(cls, ctypes_object):
@@ -157,8 +157,9 @@ class StructArray:
     def parse(self, stream):
         fields, length = self.__parse_header(stream)
 
+        element = Struct(self.following)
         for i in range(length):
-            c_type = Struct(self.following).parse(stream)
+            c_type = element.parse(stream)
             fields.append((f'element_{i}', c_type))
 
         return self.build_c_type(fields)
@@ -166,8 +167,9 @@ class StructArray:
     async def parse_async(self, stream):
         fields, length = self.__parse_header(stream)
 
+        element = Struct(self.following)
         for i in range(length):
-            c_type = await Struct(self.following).parse_async(stream)
+            c_type = await element.parse_async(stream)
             fields.append((f'element_{i}', c_type))
 
         return self.build_c_type(fields)
@@ -194,15 +196,17 @@ class StructArray:
 
     def to_python(self, ctypes_object, **kwargs):
         length = getattr(ctypes_object, 'length', 0)
+        element = Struct(self.following, dict_type=dict)
         return [
-            Struct(self.following, dict_type=dict).to_python(getattr(ctypes_object, f'element_{i}'), **kwargs)
+            element.to_python(getattr(ctypes_object, f'element_{i}'), **kwargs)
             for i in range(length)
         ]
 
     async def to_python_async(self, ctypes_object, **kwargs):
         length = getattr(ctypes_object, 'length', 0)
+        element = Struct(self.following, dict_type=dict)
         result_coro = [
-            Struct(self.following, dict_type=dict).to_python_async(getattr(ctypes_object, f'element_{i}'), **kwargs)
+            element.to_python_async(getattr(ctypes_object, f'element_{i}'), **kwargs)
             for i in range(length)
         ]
         return await asyncio.gather(*result_coro)
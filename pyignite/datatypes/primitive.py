@@ -152,4 +152,4 @@ class Bool(Primitive):
 
     @classmethod
     def from_python(cls, stream, value, **kwargs):
-        stream.write(struct.pack("<b", 1 if value else 0))
+        stream.write(b'\x01' if value else b'\x00')
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import ctypes
+import struct
 from io import SEEK_CUR
 
 from pyignite.constants import *
@@ -33,6 +34,15 @@ __all__ = [
 ]
 
 
+def _write_data(cls, stream, value):
+    if cls.data_format:
+        stream.write(struct.pack(f'<{len(value)}{cls.data_format}', *value))
+        return
+
+    for x in value:
+        cls.primitive_type.from_python(stream, x)
+
+
 class PrimitiveArray(IgniteDataType):
     """
     Base class for array of primitives. Payload-only.
@@ -40,6 +50,8 @@ class PrimitiveArray(IgniteDataType):
     _type_name = None
     _type_id = None
     primitive_type = None
+    # `struct` format of an element, if the elements can be packed at once
+    data_format = None
 
     @classmethod
     def build_c_type(cls, stream):
@@ -77,8 +89,7 @@ class PrimitiveArray(IgniteDataType):
     @classmethod
     def from_python(cls, stream, value, **kwargs):
         cls._write_header(stream, value)
-        for x in value:
-            cls.primitive_type.from_python(stream, x)
+        _write_data(cls, stream, value)
 
 
 class ByteArray(PrimitiveArray):
@@ -101,6 +112,7 @@ class ShortArray(PrimitiveArray):
     _type_name = NAME_SHORT_ARR
     _type_id = TYPE_SHORT_ARR
     primitive_type = Short
+    data_format = 'h'
     type_code = TC_SHORT_ARRAY
 
 
@@ -108,6 +120,7 @@ class IntArray(PrimitiveArray):
     _type_name = NAME_INT_ARR
     _type_id = TYPE_INT_ARR
     primitive_type = Int
+    data_format = 'i'
     type_code = TC_INT_ARRAY
 
 
@@ -115,6 +128,7 @@ class LongArray(PrimitiveArray):
     _type_name = NAME_LONG_ARR
     _type_id = TYPE_LONG_ARR
     primitive_type = Long
+    data_format = 'q'
     type_code = TC_LONG_ARRAY
 
 
@@ -122,6 +136,7 @@ class FloatArray(PrimitiveArray):
     _type_name = NAME_FLOAT_ARR
     _type_id = TYPE_FLOAT_ARR
     primitive_type = Float
+    data_format = 'f'
     type_code = TC_FLOAT_ARRAY
 
 
@@ -129,6 +144,7 @@ class DoubleArray(PrimitiveArray):
     _type_name = NAME_DOUBLE_ARR
     _type_id = TYPE_DOUBLE_ARR
     primitive_type = Double
+    data_format = 'd'
     type_code = TC_DOUBLE_ARRAY
 
 
@@ -143,6 +159,7 @@ class BoolArray(PrimitiveArray):
     _type_name = NAME_BOOLEAN_ARR
     _type_id = TYPE_BOOLEAN_ARR
     primitive_type = Bool
+    data_format = '?'
     type_code = TC_BOOL_ARRAY
 
 
@@ -153,6 +170,7 @@ class PrimitiveArrayObject(Nullable):
     _type_name = None
     _type_id = None
     primitive_type = None
+    data_format = None
     type_code = None
     pythonic = list
     default = []
@@ -190,8 +208,7 @@ class PrimitiveArrayObject(Nullable):
     @classmethod
     def from_python_not_null(cls, stream, value, **kwargs):
         cls._write_header(stream, value)
-        for x in value:
-            cls.primitive_type.from_python(stream, x)
+        _write_data(cls, stream, value)
 
     @classmethod
     def _write_header(cls, stream, value):
@@ -239,6 +256,7 @@ class ShortArrayObject(PrimitiveArrayObject):
     _type_name = NAME_SHORT_ARR
     _type_id = TYPE_SHORT_ARR
     primitive_type = Short
+    data_format = 'h'
     type_code = TC_SHORT_ARRAY
 
 
@@ -246,6 +264,7 @@ class IntArrayObject(PrimitiveArrayObject):
     _type_name = NAME_INT_ARR
     _type_id = TYPE_INT_ARR
     primitive_type = Int
+    data_format = 'i'
     type_code = TC_INT_ARRAY
 
 
@@ -253,6 +272,7 @@ class LongArrayObject(PrimitiveArrayObject):
     _type_name = NAME_LONG_ARR
     _type_id = TYPE_LONG_ARR
     primitive_type = Long
+    data_format = 'q'
     type_code = TC_LONG_ARRAY
 
 
@@ -260,6 +280,7 @@ class FloatArrayObject(PrimitiveArrayObject):
     _type_name = NAME_FLOAT_ARR
     _type_id = TYPE_FLOAT_ARR
     primitive_type = Float
+    data_format = 'f'
     type_code = TC_FLOAT_ARRAY
 
 
@@ -267,6 +288,7 @@ class DoubleArrayObject(PrimitiveArrayObject):
     _type_name = NAME_DOUBLE_ARR
     _type_id = TYPE_DOUBLE_ARR
     primitive_type = Double
+    data_format = 'd'
     type_code = TC_DOUBLE_ARRAY
 
 
@@ -293,6 +315,7 @@ class BoolArrayObject(PrimitiveArrayObject):
     _type_name = NAME_BOOLEAN_ARR
     _type_id = TYPE_BOOLEAN_ARR
     primitive_type = Bool
+    data_format = '?'
     type_code = TC_BOOL_ARRAY
 
     @classmethod
@@ -111,17 +111,9 @@ class String(Nullable):
     def from_python_not_null(cls, stream, value, **kwargs):
         if isinstance(value, str):
             value = value.encode(PROTOCOL_STRING_ENCODING)
-        length = len(value)
-        data_type = cls.build_c_type(length)
-        data_object = data_type()
-        data_object.type_code = int.from_bytes(
-            cls.type_code,
-            byteorder=PROTOCOL_BYTE_ORDER
-        )
-        data_object.length = length
-        data_object.data = value
-
-        stream.write(data_object)
+        # header and payload are written as is, building a ctypes class for each string is too expensive
+        stream.write(cls.type_code + len(value).to_bytes(ctypes.sizeof(ctypes.c_int), byteorder=PROTOCOL_BYTE_ORDER))
+        stream.write(value)
 
 
 class DecimalObject(Nullable):
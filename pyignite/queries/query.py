@@ -14,40 +14,41 @@
 # limitations under the License.
 
 import ctypes
-from io import SEEK_CUR
-from random import randint
+import struct
+from random import getrandbits
+from typing import Union
 
 import attr
 
 from pyignite.api.result import APIResult
 from pyignite.connection import Connection, AioConnection
 from pyignite.connection.protocol_context import ProtocolContext
-from pyignite.constants import MIN_LONG, MAX_LONG, RHF_TOPOLOGY_CHANGED, PROTOCOL_BYTE_ORDER
+from pyignite.constants import MIN_LONG, RHF_TOPOLOGY_CHANGED
 from pyignite.datatypes import ExpiryPolicy
 from pyignite.exceptions import NotSupportedByClusterError
-from pyignite.queries.response import Response
+from pyignite.queries.response import Response, _primitive_formats
+from pyignite.queries.utils import _is_sync
 from pyignite.stream import AioBinaryStream, BinaryStream, READ_BACKWARD
 
 
 def query_perform(query_struct, conn, post_process_fun=None, **kwargs):
-    async def _async_internal():
-        result = await query_struct.perform_async(conn, **kwargs)
-        if post_process_fun:
-            return post_process_fun(result)
-        return result
+    if isinstance(conn, AioConnection):
+        return _query_perform_async(query_struct, conn, post_process_fun, **kwargs)
 
-    def _internal():
-        result = query_struct.perform(conn, **kwargs)
-        if post_process_fun:
-            return post_process_fun(result)
-        return result
+    result = query_struct.perform(conn, **kwargs)
+    if post_process_fun:
+        return post_process_fun(result)
+    return result
 
-    if isinstance(conn, AioConnection):
-        return _async_internal()
-    return _internal()
+
+async def _query_perform_async(query_struct, conn, post_process_fun=None, **kwargs):
+    result = await query_struct.perform_async(conn, **kwargs)
+    if post_process_fun:
+        return post_process_fun(result)
+    return result
 
 
-@attr.s
+@attr.s(slots=True)
 class CacheInfo:
     cache_id = attr.ib(kw_only=True, type=int)
     expiry_policy = attr.ib(kw_only=True, type=ExpiryPolicy, default=None)
@@ -59,93 +60,204 @@ class CacheInfo:
 
     @classmethod
     def from_python(cls, stream, value):
-        cache_id = value.cache_id if value else 0
-        expiry_policy = value.expiry_policy if value else None
-        flags = 0
+        if not (value and value.expiry_policy):
+            # cache ID and empty flags
+            stream.write(_cache_info_struct.pack(value.cache_id if value else 0, 0))
+            return
 
-        stream.write(cache_id.to_bytes(4, byteorder=PROTOCOL_BYTE_ORDER, signed=True))
+        if not value.protocol_context.is_expiry_policy_supported():
+            raise NotSupportedByClusterError("'ExpiryPolicy' API is not supported by the cluster")
 
-        if expiry_policy:
-            if not value.protocol_context.is_expiry_policy_supported():
-                raise NotSupportedByClusterError("'ExpiryPolicy' API is not supported by the cluster")
-            flags |= 0x04
+        stream.write(_cache_info_struct.pack(value.cache_id, 0x04))
+        ExpiryPolicy.write_policy(stream, value.expiry_policy)
 
-        stream.write(flags.to_bytes(1, byteorder=PROTOCOL_BYTE_ORDER))
-        if expiry_policy:
-            ExpiryPolicy.write_policy(stream, expiry_policy)
 
+_length_size = ctypes.sizeof(ctypes.c_int)
+_length_struct = struct.Struct('<i')
 
-@attr.s
+# cache ID, flags
+_cache_info_struct = struct.Struct('<iB')
+
+
+@attr.s(slots=True)
 class Query:
     op_code = attr.ib(type=int)
     following = attr.ib(type=list, factory=list)
     query_id = attr.ib(type=int, default=None)
     response_type = attr.ib(type=type(Response), default=Response)
-    _query_c_type = None
+    # derived from `following` in `__attrs_post_init__`
+    _writers = attr.ib(init=False, repr=False, eq=False)
+    _async_writers = attr.ib(init=False, repr=False, eq=False)
+    _fixed_struct = attr.ib(init=False, repr=False, eq=False)
+    _fixed_length = attr.ib(init=False, repr=False, eq=False)
+    _cache_info_first = attr.ib(init=False, repr=False, eq=False)
+    _header_slot = attr.ib(init=False, repr=False, eq=False)
+    # length, op_code, query_id
+    _header_struct = struct.Struct('<ihq')
+
+    def __attrs_post_init__(self):
+        # writers are bound once per query, not looked up for each field of each request,
+        # async ones are bound on the first use
+        self._writers = tuple(c_type.from_python for _, c_type in self.following)
+        self._async_writers = None
+
+        # queries made of primitive fields only (e.g. cursor ID) have a fixed layout,
+        # so header and fields are packed at once
+        self._fixed_struct, self._fixed_length = None, None
+        if all(isinstance(c_type, type) and c_type in _primitive_formats for _, c_type in self.following):
+            self._fixed_struct = struct.Struct(
+                self._header_struct.format + ''.join(_primitive_formats[c_type] for _, c_type in self.following)
+            )
+            self._fixed_length = self._fixed_struct.size - _length_size
 
-    @classmethod
-    def build_c_type(cls):
-        if cls._query_c_type is None:
-            cls._query_c_type = type(
-                cls.__name__,
-                (ctypes.LittleEndianStructure,),
-                {
-                    '_pack_': 1,
-                    '_fields_': [
-                        ('length', ctypes.c_int),
-                        ('op_code', ctypes.c_short),
-                        ('query_id', ctypes.c_longlong),
-                    ],
-                },
+        # most of the queries start with a cache info, which is written along with the header slot
+        self._cache_info_first = bool(self.following) and self.following[0][1] is CacheInfo
+
+        # when the query ID is known, only the length is left to be filled in the header slot
+        if self.query_id is None:
+            self._header_slot = bytes(self._header_struct.size)
+        else:
+            self._header_slot = Query._header_struct.pack(0, self.op_code, self.query_id).ljust(
+                self._header_struct.size, b'\x00'
             )
-        return cls._query_c_type
 
-    def from_python(self, stream, values: dict = None):
-        init_pos, header = stream.tell(), self._build_header(stream)
-        values = values if values else None
+    def with_query_id(self, query_id: int = None) -> 'Query':
+        """
+        Returns the query bound to the given query ID. Allows to define
+        queries once and share them between the calls.
 
-        for name, c_type in self.following:
-            c_type.from_python(stream, values[name])
+        :param query_id: (optional) a value generated by client and returned
+         as-is in response.query_id,
+        :return: this query, if query ID is omitted or the same, a copy
+         of this query otherwise.
+        """
+        if query_id is None or query_id == self.query_id:
+            return self
+        return attr.evolve(self, query_id=query_id)
 
-        self.__write_header(stream, header, init_pos)
+    def with_hints(self, **hints) -> 'Query':
+        """
+        Returns the query with the types of the given fields replaced
+        by type hints.
 
-    async def from_python_async(self, stream, values: dict = None):
-        init_pos, header = stream.tell(), self._build_header(stream)
-        values = values if values else None
+        :param hints: type hints by field names. Fields with omitted
+         or None hints keep their types,
+        :return: this query, if there are no hints, a copy of this query
+         otherwise.
+        """
+        if not any(hints.values()):
+            return self
+        return attr.evolve(self, following=[(name, hints.get(name) or c_type) for name, c_type in self.following])
 
-        for name, c_type in self.following:
-            await c_type.from_python_async(stream, values[name])
+    def from_python(self, stream, values: Union[dict, tuple] = None):
+        """
+        Writes the query to the stream.
 
-        self.__write_header(stream, header, init_pos)
+        :param stream: binary stream,
+        :param values: (optional) query parameters, either a dict of named
+         parameters, or a tuple of them in the order of `following`.
+        """
+        self.from_python_positional(stream, self.__to_positional(values))
 
-    def _build_header(self, stream):
-        header_class = self.build_c_type()
-        header_len = ctypes.sizeof(header_class)
-        stream.seek(header_len, SEEK_CUR)
+    async def from_python_async(self, stream, values: Union[dict, tuple] = None):
+        await self.from_python_positional_async(stream, self.__to_positional(values))
 
-        header = header_class()
-        header.op_code = self.op_code
-        if self.query_id is None:
-            header.query_id = randint(MIN_LONG, MAX_LONG)
+    def from_python_positional(self, stream, values: tuple = ()):
+        self.__check_values(values)
+        if self._fixed_struct:
+            self.__write_fixed(stream, values)
+            return
 
-        return header
+        init_pos, header, start = self._build_header(stream, values)
 
-    @staticmethod
-    def __write_header(stream, header, init_pos):
-        header.length = stream.tell() - init_pos - ctypes.sizeof(ctypes.c_int)
-        stream.seek(init_pos)
-        stream.write(header)
+        for writer, value in zip(self._writers[start:], values[start:]):
+            writer(stream, value)
+
+        self._write_header(stream, header, init_pos)
+
+    async def from_python_positional_async(self, stream, values: tuple = ()):
+        self.__check_values(values)
+        if self._fixed_struct:
+            self.__write_fixed(stream, values)
+            return
+
+        init_pos, header, start = self._build_header(stream, values)
+
+        if self._async_writers is None:
+            self._async_writers = tuple(
+                (c_type.from_python, False) if _is_sync(c_type, 'from_python', CacheInfo.from_python_async.__func__)
+                else (c_type.from_python_async, True)
+                for _, c_type in self.following
+            )
+
+        for (writer, is_async), value in zip(self._async_writers[start:], values[start:]):
+            if is_async:
+                await writer(stream, value)
+            else:
+                writer(stream, value)
+
+        self._write_header(stream, header, init_pos)
+
+    def __check_values(self, values):
+        if len(values) != len(self.following):
+            raise ValueError(f'Query expects {len(self.following)} parameters, {len(values)} given')
+
+    def __to_positional(self, values):
+        if isinstance(values, dict):
+            return tuple(values[name] for name, _ in self.following)
+        return values or ()
+
+    def _get_query_id(self):
+        # a random signed 64-bit value, unlike `randint` it takes a single call to the generator
+        return getrandbits(64) + MIN_LONG if self.query_id is None else self.query_id
+
+    def _build_header(self, stream, values=()):
+        """
+        Reserves the header slot, which is filled once the body length
+        is known.
+
+        :return: position of the slot, header values (None, if they are
+         already in the slot) and the index of the first field, that is
+         yet to be written.
+        """
+        header = None if self.query_id is not None else (self.op_code, self._get_query_id())
+        init_pos = stream.tell()
+
+        if self._cache_info_first:
+            cache_info = values[0]
+            if not (cache_info and cache_info.expiry_policy):
+                stream.write(self._header_slot + _cache_info_struct.pack(cache_info.cache_id if cache_info else 0, 0))
+                return init_pos, header, 1
+
+        stream.write(self._header_slot)
+        return init_pos, header, 0
+
+    def __write_fixed(self, stream, values):
+        stream.write(self._fixed_struct.pack(
+            self._fixed_length,
+            self.op_code,
+            self._get_query_id(),
+            *values
+        ))
+
+    def _write_header(self, stream, header, init_pos):
+        length = stream.tell() - init_pos - _length_size
+        if header is None:
+            _length_struct.pack_into(stream.getbuffer(), init_pos, length)
+        else:
+            Query._header_struct.pack_into(stream.getbuffer(), init_pos, length, *header)
 
     def perform(
-        self, conn: Connection, query_params: dict = None,
+        self, conn: Connection, query_params: Union[dict, tuple] = None,
         response_config: list = None, **kwargs,
     ) -> APIResult:
         """
         Perform query and process result.
 
         :param conn: connection to Ignite server,
-        :param query_params: (optional) dict of named query parameters.
-         Defaults to no parameters,
+        :param query_params: (optional) dict of named query parameters
+         or a tuple of them in the order of `following`. Defaults to
+         no parameters,
         :param response_config: (optional) response configuration − list of
          (name, type_hint) tuples. Defaults to empty return value,
         :return: instance of :class:`~pyignite.api.result.APIResult` with raw
@@ -153,31 +265,36 @@ class Query:
         """
         with BinaryStream(conn.client) as stream:
             self.from_python(stream, query_params)
-            response_data = conn.request(stream.getvalue())
+            # the socket sends straight from the stream buffer, there is no need to copy it
+            response_data = conn.request(stream.getbuffer())
 
-        response_struct = self.response_type(protocol_context=conn.protocol_context,
-                                             following=response_config, **kwargs)
+        response_struct = self.__get_response_struct(conn, response_config, kwargs)
 
         with BinaryStream(conn.client, response_data) as stream:
-            response_ctype = response_struct.parse(stream)
-            response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
+            fused = response_struct.parse_to_python(stream)
+            if fused is None:
+                response_ctype = response_struct.parse(stream)
+                response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
+            else:
+                response, value = fused
 
         result = self.__post_process_response(conn, response_struct, response)
 
         if result.status == 0:
-            result.value = response_struct.to_python(response)
+            result.value = response_struct.to_python(response) if fused is None else value
         return result
 
     async def perform_async(
-        self, conn: AioConnection, query_params: dict = None,
+        self, conn: AioConnection, query_params: Union[dict, tuple] = None,
         response_config: list = None, **kwargs,
     ) -> APIResult:
         """
         Perform query and process result.
 
         :param conn: connection to Ignite server,
-        :param query_params: (optional) dict of named query parameters.
-         Defaults to no parameters,
+        :param query_params: (optional) dict of named query parameters
+         or a tuple of them in the order of `following`. Defaults to
+         no parameters,
         :param response_config: (optional) response configuration − list of
          (name, type_hint) tuples. Defaults to empty return value,
         :return: instance of :class:`~pyignite.api.result.APIResult` with raw
@@ -187,19 +304,38 @@ class Query:
             await self.from_python_async(stream, query_params)
             data = await conn.request(stream.getvalue())
 
-        response_struct = self.response_type(protocol_context=conn.protocol_context,
-                                             following=response_config, **kwargs)
+        response_struct = self.__get_response_struct(conn, response_config, kwargs)
 
         with AioBinaryStream(conn.client, data) as stream:
-            response_ctype = await response_struct.parse_async(stream)
-            response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
+            fused = response_struct.parse_to_python(stream)
+            if fused is None:
+                response_ctype = await response_struct.parse_async(stream)
+                response = stream.read_ctype(response_ctype, direction=READ_BACKWARD)
+            else:
+                response, value = fused
 
         result = self.__post_process_response(conn, response_struct, response)
 
         if result.status == 0:
-            result.value = await response_struct.to_python_async(response)
+            result.value = await response_struct.to_python_async(response) if fused is None else value
         return result
 
+    def __get_response_struct(self, conn, response_config, kwargs):
+        protocol_context = conn.protocol_context
+        try:
+            key = (self.response_type, tuple(response_config or ()), tuple(kwargs.items()))
+            response_struct = conn._response_structs.get(key)
+        except TypeError:
+            # response config holds unhashable type hints
+            key, response_struct = None, None
+
+        if response_struct is None or response_struct.protocol_context is not protocol_context:
+            response_struct = self.response_type(protocol_context=protocol_context,
+                                                 following=response_config, **kwargs)
+            if key is not None:
+                conn._response_structs[key] = response_struct
+        return response_struct
+
     @staticmethod
     def __post_process_response(conn, response_struct, response):
         if getattr(response, 'flags', False) & RHF_TOPOLOGY_CHANGED:
@@ -214,31 +350,20 @@ class Query:
         return APIResult(response)
 
 
+@attr.s(slots=True)
 class ConfigQuery(Query):
     """
     This is a special query, used for creating caches with configuration.
     """
-    _query_c_type = None
-
-    @classmethod
-    def build_c_type(cls):
-        if cls._query_c_type is None:
-            cls._query_c_type = type(
-                cls.__name__,
-                (ctypes.LittleEndianStructure,),
-                {
-                    '_pack_': 1,
-                    '_fields_': [
-                        ('length', ctypes.c_int),
-                        ('op_code', ctypes.c_short),
-                        ('query_id', ctypes.c_longlong),
-                        ('config_length', ctypes.c_int),
-                    ],
-                },
-            )
-        return cls._query_c_type
-
-    def _build_header(self, stream):
-        header = super()._build_header(stream)
-        header.config_length = header.length - ctypes.sizeof(type(header))
-        return header
+    # length, op_code, query_id, config_length
+    _header_struct = struct.Struct('<ihqi')
+
+    def __attrs_post_init__(self):
+        super().__attrs_post_init__()
+        # config length is only known after the fields are written
+        self._fixed_struct, self._fixed_length = None, None
+
+    def _write_header(self, stream, header, init_pos):
+        config_length = stream.tell() - init_pos - self._header_struct.size
+        _length_struct.pack_into(stream.getbuffer(), init_pos + Query._header_struct.size, config_length)
+        super()._write_header(stream, header, init_pos)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import struct
 from io import SEEK_CUR
 
 import attr
@@ -20,10 +21,13 @@ from collections import OrderedDict
 import ctypes
 
 from pyignite.connection.protocol_context import ProtocolContext
-from pyignite.constants import RHF_TOPOLOGY_CHANGED, RHF_ERROR
-from pyignite.datatypes import AnyDataObject, Bool, Int, Long, String, StringArray, Struct
+from pyignite.constants import PROTOCOL_BYTE_ORDER, RHF_TOPOLOGY_CHANGED, RHF_ERROR
+from pyignite.datatypes import (
+    AnyDataObject, Bool, Byte, Double, Float, Int, Long, Short, String, StringArray, Struct,
+)
 from pyignite.datatypes.binary import body_struct, enum_struct, schema_struct
 from pyignite.queries.op_codes import OP_SUCCESS
+from pyignite.queries.utils import _is_sync
 from pyignite.stream import READ_BACKWARD
 
 
@@ -45,6 +49,34 @@ class ResponseHeader(ctypes.LittleEndianStructure):
     ]
 
 
+@attr.s(slots=True)
+class ErrorResponse:
+    """
+    Header and error message of the failed request, parsed without
+    building the response class.
+    """
+    query_id = attr.ib(type=int)
+    status_code = attr.ib(type=int)
+    error_message = attr.ib()
+
+
+_status_flag_response_header_size = ctypes.sizeof(StatusFlagResponseHeader)
+_response_header_size = ctypes.sizeof(ResponseHeader)
+
+_static_response_classes = {}
+
+
+_primitive_formats = {
+    Bool: '?',
+    Byte: 'b',
+    Short: 'h',
+    Int: 'i',
+    Long: 'q',
+    Float: 'f',
+    Double: 'd',
+}
+
+
 @attr.s
 class Response:
     following = attr.ib(type=list, factory=list)
@@ -54,22 +86,29 @@ class Response:
     def __attrs_post_init__(self):
         # replace None with empty list
         self.following = self.following or []
+        self._body_format = self._get_body_format()
+
+    def _get_body_format(self):
+        # successful responses made of fixed-size primitive fields are unpacked at once
+        if all(isinstance(c_type, type) and c_type in _primitive_formats for _, c_type in self.following):
+            return '<' + ''.join(_primitive_formats[c_type] for _, c_type in self.following)
+        return None
 
     def __parse_header(self, stream):
         init_pos = stream.tell()
 
-        if self.protocol_context.is_status_flags_supported():
-            header_class = StatusFlagResponseHeader
+        status_flags_supported = self.protocol_context.is_status_flags_supported()
+        if status_flags_supported:
+            header_class, header_len = StatusFlagResponseHeader, _status_flag_response_header_size
         else:
-            header_class = ResponseHeader
+            header_class, header_len = ResponseHeader, _response_header_size
 
-        header_len = ctypes.sizeof(header_class)
         header = stream.read_ctype(header_class)
         stream.seek(header_len, SEEK_CUR)
 
         fields = []
         has_error = False
-        if self.protocol_context.is_status_flags_supported():
+        if status_flags_supported:
             if header.flags & RHF_TOPOLOGY_CHANGED:
                 fields = [
                     ('affinity_version', ctypes.c_longlong),
@@ -92,6 +131,15 @@ class Response:
         return not has_error, init_pos, header_class, fields
 
     def __build_response_class(self, stream, init_pos, header_class, fields):
+        # fixed-size fields always produce the same class, so it is built only once
+        cache_key = None
+        if all(issubclass(c_type, ctypes._SimpleCData) for _, c_type in fields):
+            cache_key = (self._response_class_name, header_class, tuple(fields))
+            response_class = _static_response_classes.get(cache_key)
+            if response_class is not None:
+                stream.seek(init_pos + ctypes.sizeof(response_class))
+                return response_class
+
         response_class = type(
             self._response_class_name,
             (header_class,),
@@ -100,10 +148,54 @@ class Response:
                 '_fields_': fields,
             }
         )
+        if cache_key is not None:
+            _static_response_classes[cache_key] = response_class
 
         stream.seek(init_pos + ctypes.sizeof(response_class))
         return response_class
 
+    def parse_to_python(self, stream):
+        """
+        Parses the response and converts its value in a single pass.
+        Supported are the failed responses, whose body is only an error
+        message, and the successful responses made of fixed-size
+        primitive fields, as their layout is known beforehand.
+
+        :return: response header and value, or None, if the response
+         is to be parsed and converted the usual way.
+        """
+        if self.protocol_context.is_status_flags_supported():
+            header = stream.read_ctype(StatusFlagResponseHeader)
+            # topology change adds fields to the header
+            if header.flags & RHF_TOPOLOGY_CHANGED:
+                return None
+            body_pos = stream.tell() + _status_flag_response_header_size
+            if header.flags & RHF_ERROR:
+                status_code = int.from_bytes(stream.slice(body_pos, 4), PROTOCOL_BYTE_ORDER, signed=True)
+                return self.__parse_error(stream, header, status_code, body_pos + 4)
+        else:
+            header = stream.read_ctype(ResponseHeader)
+            body_pos = stream.tell() + _response_header_size
+            if header.status_code != OP_SUCCESS:
+                return self.__parse_error(stream, header, header.status_code, body_pos)
+
+        if self._body_format is None:
+            return None
+
+        if not self.following:
+            return header, None
+
+        values = struct.unpack_from(self._body_format, stream.getbuffer(), body_pos)
+        return header, OrderedDict(zip((name for name, _ in self.following), values))
+
+    @staticmethod
+    def __parse_error(stream, header, status_code, message_pos):
+        # the success schema is never parsed for the failed requests
+        stream.seek(message_pos)
+        message_class = String.parse(stream)
+        message = stream.read_ctype(message_class, direction=READ_BACKWARD)
+        return ErrorResponse(query_id=header.query_id, status_code=status_code, error_message=message), None
+
     def parse(self, stream):
         success, init_pos, header_class, fields = self.__parse_header(stream)
         if success:
@@ -142,6 +234,9 @@ class Response:
         if not self.following:
             return None
 
+        if all(_is_sync(c_type, 'to_python') for _, c_type in self.following):
+            return self.to_python(ctypes_object, **kwargs)
+
         values = await asyncio.gather(
             *[c_type.to_python_async(getattr(ctypes_object, name), **kwargs) for name, c_type in self.following]
         )
@@ -161,6 +256,10 @@ class SQLResponse(Response):
     has_cursor = attr.ib(type=bool, default=False)
     _response_class_name = 'SQLResponse'
 
+    def _get_body_format(self):
+        # the body is never made of fixed-size fields only
+        return None
+
     def fields_or_field_count(self):
         if self.include_field_names:
             return 'fields', StringArray
@@ -172,11 +271,12 @@ class SQLResponse(Response):
         body = stream.read_ctype(body_class, direction=READ_BACKWARD)
 
         data_fields, field_count = [], self.__get_fields_count(body)
+        column_names = self.__column_names(field_count)
         for i in range(body.row_count):
             row_fields = []
-            for j in range(field_count):
+            for column_name in column_names:
                 field_class = AnyDataObject.parse(stream)
-                row_fields.append(('column_{}'.format(j), field_class))
+                row_fields.append((column_name, field_class))
 
             self.__row_post_process(i, row_fields, data_fields)
 
@@ -188,11 +288,12 @@ class SQLResponse(Response):
         body = stream.read_ctype(body_class, direction=READ_BACKWARD)
 
         data_fields, field_count = [], self.__get_fields_count(body)
+        column_names = self.__column_names(field_count)
         for i in range(body.row_count):
             row_fields = []
-            for j in range(field_count):
+            for column_name in column_names:
                 field_class = await AnyDataObject.parse_async(stream)
-                row_fields.append(('column_{}'.format(j), field_class))
+                row_fields.append((column_name, field_class))
 
             self.__row_post_process(i, row_fields, data_fields)
 
@@ -209,6 +310,10 @@ class SQLResponse(Response):
             return body.fields.length
         return body.field_count
 
+    @staticmethod
+    def __column_names(field_count):
+        return [f'column_{i}' for i in range(field_count)]
+
     @staticmethod
     def __row_post_process(idx, row_fields, data_fields):
         row_class = type(
@@ -289,14 +394,17 @@ class SQLResponse(Response):
 class BinaryTypeResponse(Response):
     _response_class_name = 'GetBinaryTypeResponse'
 
+    def _get_body_format(self):
+        # the body is never made of fixed-size fields only
+        return None
+
     def _parse_success(self, stream, fields: list):
         type_exists = self.__process_type_exists(stream, fields)
 
         if type_exists.value:
             resp_body_type = body_struct.parse(stream)
             fields.append(('body', resp_body_type))
-            resp_body = stream.read_ctype(resp_body_type, direction=READ_BACKWARD)
-            if resp_body.is_enum:
+            if self.__is_enum(stream):
                 resp_enum = enum_struct.parse(stream)
                 fields.append(('enums', resp_enum))
 
@@ -309,8 +417,7 @@ class BinaryTypeResponse(Response):
         if type_exists.value:
             resp_body_type = await body_struct.parse_async(stream)
             fields.append(('body', resp_body_type))
-            resp_body = stream.read_ctype(resp_body_type, direction=READ_BACKWARD)
-            if resp_body.is_enum:
+            if self.__is_enum(stream):
                 resp_enum = await enum_struct.parse_async(stream)
                 fields.append(('enums', resp_enum))
 
@@ -325,19 +432,26 @@ class BinaryTypeResponse(Response):
 
         return type_exists
 
+    @staticmethod
+    def __is_enum(stream):
+        # `is_enum` is the last byte of the body, so there is no need to copy the whole body
+        return stream.read_ctype(ctypes.c_byte, direction=READ_BACKWARD).value
+
     def to_python(self, ctypes_object, **kwargs):
         if getattr(ctypes_object, 'status_code', 0) == 0:
+            type_exists = Bool.to_python(ctypes_object.type_exists)
             result = {
-                'type_exists': Bool.to_python(ctypes_object.type_exists)
+                'type_exists': type_exists
             }
 
-            if hasattr(ctypes_object, 'body'):
+            # body and schema are sent only if the type exists,
+            # enums are sent only for enum types
+            if type_exists:
                 result.update(body_struct.to_python(ctypes_object.body))
 
-            if hasattr(ctypes_object, 'enums'):
-                result['enums'] = enum_struct.to_python(ctypes_object.enums)
+                if result['is_enum']:
+                    result['enums'] = enum_struct.to_python(ctypes_object.enums)
 
-            if hasattr(ctypes_object, 'schema'):
                 result['schema'] = {
                     x['schema_id']: [
                         z['schema_field_id'] for z in x['schema_fields']
@@ -0,0 +1,35 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pyignite.datatypes import Nullable
+from pyignite.datatypes.base import IgniteDataType
+
+
+def _is_sync(c_type, method: str, *delegates) -> bool:
+    """
+    Checks if the async variant of a data type method only delegates
+    to the sync one, so there is nothing to await.
+
+    :param c_type: data type,
+    :param method: sync method name, `from_python` or `to_python`,
+    :param delegates: other async functions that are known to delegate
+     to the sync ones,
+    :return: True if the sync method can be called instead.
+    """
+    func = getattr(getattr(c_type, f'{method}_async'), '__func__', None)
+    if func is getattr(Nullable, f'{method}_async').__func__:
+        return getattr(getattr(c_type, f'{method}_not_null_async'), '__func__', None) is \
+            getattr(Nullable, f'{method}_not_null_async').__func__
+    return func is getattr(IgniteDataType, f'{method}_async').__func__ or func in delegates
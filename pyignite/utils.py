@@ -18,7 +18,7 @@ import decimal
 import inspect
 import warnings
 
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Optional, Type, Tuple, Union
 
 from pyignite.datatypes.base import IgniteDataType
@@ -34,6 +34,7 @@ except ImportError:
 
 LONG_MASK = 0xffffffff
 DIGITS_PER_INT = 9
+ID_CACHE_SIZE = 1024
 
 
 def is_pow2(value: int) -> bool:
@@ -120,6 +121,7 @@ def __hashcode_fallback(data: Union[str, bytes, bytearray, memoryview]) -> int:
     return result
 
 
+@lru_cache(maxsize=ID_CACHE_SIZE)
 def cache_id(cache: Union[str, int]) -> int:
     """
     Create a cache ID from cache name.
@@ -130,6 +132,7 @@ def cache_id(cache: Union[str, int]) -> int:
     return cache if type(cache) is int else hashcode(cache)
 
 
+@lru_cache(maxsize=ID_CACHE_SIZE)
 def entity_id(cache: Union[str, int]) -> Optional[int]:
     """
     Create a type ID from type name or field ID from field name.
@@ -137,9 +140,15 @@ def entity_id(cache: Union[str, int]) -> Optional[int]:
     :param cache: entity name or ID,
     :return: entity ID.
     """
+    if FALLBACK:
+        return __entity_id_fallback(cache)
+    return _cutils.entity_id(cache)
+
+
+def __entity_id_fallback(cache: Union[str, int]) -> Optional[int]:
     if cache is None:
         return None
-    return cache if type(cache) is int else hashcode(cache.lower())
+    return cache if type(cache) is int else __hashcode_fallback(cache.lower())
 
 
 def schema_id(schema: Union[int, dict]) -> int:
@@ -161,18 +170,14 @@ def __schema_id_fallback(schema: Union[int, dict]) -> int:
     if schema is None:
         return 0
 
+    # the hash is accumulated as an unsigned 32-bit value, so masking
+    # is enough after each multiplication, and the sign is restored once
     s_id = FNV1_OFFSET_BASIS if schema else 0
     for field_name in schema.keys():
         field_id = __hashcode_fallback(field_name.lower())
-        s_id ^= (field_id & 0xff)
-        s_id = int_overflow(s_id * FNV1_PRIME)
-        s_id ^= ((field_id >> 8) & 0xff)
-        s_id = int_overflow(s_id * FNV1_PRIME)
-        s_id ^= ((field_id >> 16) & 0xff)
-        s_id = int_overflow(s_id * FNV1_PRIME)
-        s_id ^= ((field_id >> 24) & 0xff)
-        s_id = int_overflow(s_id * FNV1_PRIME)
-    return s_id
+        for b in field_id.to_bytes(4, PROTOCOL_BYTE_ORDER, signed=True):
+            s_id = ((s_id ^ b) * FNV1_PRIME) & LONG_MASK
+    return int_overflow(s_id)
 
 
 def decimal_hashcode(value: decimal.Decimal) -> int:
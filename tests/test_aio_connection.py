@@ -0,0 +1,248 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import struct
+import uuid
+
+import pytest
+
+from pyignite import AioClient
+from pyignite.api.key_value import cache_get_async, cache_put_async
+from pyignite.datatypes import String
+from pyignite.exceptions import SocketError
+from pyignite.queries.op_codes import OP_CACHE_GET
+from pyignite.stream import BinaryStream
+
+TIMEOUT = 5
+
+
+class FakeServer:
+    """
+    Minimal server that accepts a handshake, answers ``OP_CACHE_GET``
+    requests for ``LongObject`` keys with ``'v<key>'`` and any other request
+    with an empty success response.
+    """
+    def __init__(self):
+        self.reverse = False
+        self.drop_on_request = False
+        self.hold = False
+        self.reading = asyncio.Event()
+        self.reading.set()
+        self.connections = 0
+        self.query_ids = []
+        self.port = None
+        self._server = None
+        self._writers = []
+        self._held = []
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.reading.set()
+        self.drop_connections()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def drop_connections(self):
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    def release(self):
+        """ Send the responses held back so far. """
+        self.hold = False
+        for writer, responses in self._held:
+            writer.write(responses)
+        self._held.clear()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.append(writer)
+
+        header = await reader.readexactly(4)
+        await reader.readexactly(int.from_bytes(header, 'little'))
+        # successful handshake with protocol features and node UUID
+        body = b'\x01\x0c' + struct.pack('<i', 1) + b'\x00\x0a' + uuid.uuid4().bytes
+        writer.write(struct.pack('<i', len(body)) + body)
+
+        buffer = b''
+        while True:
+            await self.reading.wait()
+            try:
+                data = await reader.read(65536)
+            except ConnectionError:
+                break
+            if not data:
+                break
+            if self.drop_on_request:
+                writer.close()
+                break
+
+            buffer += data
+            responses = []
+            while len(buffer) >= 4 and len(buffer) >= 4 + int.from_bytes(buffer[:4], 'little'):
+                length = int.from_bytes(buffer[:4], 'little')
+                frame, buffer = buffer[:4 + length], buffer[4 + length:]
+                responses.append(self._respond(frame))
+
+            if self.reverse:
+                responses.reverse()
+            if self.hold:
+                self._held.append((writer, b''.join(responses)))
+            else:
+                writer.write(b''.join(responses))
+
+    def _respond(self, frame):
+        op_code = struct.unpack('<h', frame[4:6])[0]
+        query_id = frame[6:14]
+        self.query_ids.append(struct.unpack('<q', query_id)[0])
+        with BinaryStream(None) as stream:
+            stream.write(query_id)
+            stream.write(struct.pack('<h', 0))
+            if op_code == OP_CACHE_GET:
+                key = struct.unpack('<q', frame[-8:])[0]
+                String.from_python(stream, 'v%d' % key)
+            payload = stream.getvalue()
+        return struct.pack('<i', len(payload)) + payload
+
+
+@pytest.fixture
+async def server():
+    srv = FakeServer()
+    await srv.start()
+    yield srv
+    await srv.stop()
+
+
+@pytest.fixture
+async def client(server):
+    cl = AioClient(partition_aware=False)
+    async with cl.connect('127.0.0.1', server.port):
+        yield cl
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_responses(server, client):
+    server.reverse = True
+    cache = await client.get_cache('cache')
+
+    res = await asyncio.wait_for(asyncio.gather(*[cache.get(i) for i in range(50)]), TIMEOUT)
+    assert res == ['v%d' % i for i in range(50)]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_query_ids(server, client):
+    server.reverse = True
+    cache = await client.get_cache('cache')
+    conn = await client.random_node()
+
+    res = await asyncio.wait_for(asyncio.gather(*[
+        cache_get_async(conn, cache.cache_info, i, query_id=42) for i in range(5)
+    ]), TIMEOUT)
+    assert [r.value for r in res] == ['v%d' % i for i in range(5)]
+    assert server.query_ids == [42] * 5
+
+
+@pytest.mark.asyncio
+async def test_connection_lost_while_idle(server, client):
+    cache = await client.get_cache('cache')
+    conn = await client.random_node()
+    assert (await cache_get_async(conn, cache.cache_info, 1)).value == 'v1'
+
+    server.drop_connections()
+    await asyncio.sleep(0.1)
+    assert not conn.alive
+
+    res = await asyncio.wait_for(cache_get_async(conn, cache.cache_info, 2), TIMEOUT)
+    assert res.value == 'v2'
+    assert server.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_connection_lost_during_request(server, client):
+    cache = await client.get_cache('cache')
+    assert await cache.get(1) == 'v1'
+
+    conn = await client.random_node()
+
+    server.drop_on_request = True
+    with pytest.raises(SocketError, match='Connection broken.'):
+        await asyncio.wait_for(cache_get_async(conn, cache.cache_info, 2), TIMEOUT)
+
+    server.drop_on_request = False
+    res = await asyncio.wait_for(cache_get_async(conn, cache.cache_info, 3), TIMEOUT)
+    assert res.value == 'v3'
+    assert server.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_with_paused_transport(server, client):
+    cache = await client.get_cache('cache')
+    conn = await client.random_node()
+
+    # StreamWriter.drain() asserts there are no concurrent waiters before Python 3.10
+    drain, draining = conn._writer.drain, []
+
+    async def exclusive_drain():
+        assert not draining
+        draining.append(True)
+        try:
+            await drain()
+        finally:
+            draining.pop()
+
+    conn._writer.drain = exclusive_drain
+
+    server.reading.clear()
+    value = 'x' * 1024 * 1024
+    puts = asyncio.gather(*[cache_put_async(conn, cache.cache_info, i, value) for i in range(16)])
+    # wait for the transport to get over its high-water mark
+    transport = conn._writer.transport
+    for _ in range(50):
+        await asyncio.sleep(0.05)
+        if transport.get_write_buffer_size() > transport.get_write_buffer_limits()[1]:
+            break
+    assert transport.get_write_buffer_size() > transport.get_write_buffer_limits()[1]
+
+    gets = asyncio.gather(*[cache.get(i) for i in range(4)])
+    await asyncio.sleep(0.05)
+    server.reading.set()
+
+    res = await asyncio.wait_for(puts, TIMEOUT)
+    assert all(r.status == 0 for r in res)
+    assert await asyncio.wait_for(gets, TIMEOUT) == ['v%d' % i for i in range(4)]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_with_explicit_query_id(server, client):
+    cache = await client.get_cache('cache')
+    conn = await client.random_node()
+
+    server.hold = True
+    cancelled = asyncio.ensure_future(cache_get_async(conn, cache.cache_info, 1, query_id=42))
+    while not server.query_ids:
+        await asyncio.sleep(0.01)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+
+    res = asyncio.ensure_future(cache_get_async(conn, cache.cache_info, 2, query_id=42))
+    await asyncio.sleep(0.05)
+    server.release()
+
+    assert (await asyncio.wait_for(res, TIMEOUT)).value == 'v2'
+    assert cancelled.cancelled()
@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import gc
+from types import SimpleNamespace
+
+import pytest
+
+import pyignite.cursors as _cursors
+from pyignite.cursors import AioSqlFieldsCursor
+from pyignite.exceptions import SocketError
+
+
+class FakeClient:
+    async def random_node(self):
+        return 'conn'
+
+    async def unwrap_binary(self, value):
+        return value
+
+
+def page(data, more, **kwargs):
+    return SimpleNamespace(status=0, value={'data': data, 'more': more, **kwargs})
+
+
+@pytest.fixture
+def closed_cursors(monkeypatch):
+    closed = []
+
+    async def sql_fields_async(conn, cache_info, *args, **kwargs):
+        return page([[1], [2]], True, cursor=42, field_count=1)
+
+    async def resource_close_async(conn, cursor_id):
+        closed.append(cursor_id)
+
+    monkeypatch.setattr(_cursors, 'sql_fields_async', sql_fields_async)
+    monkeypatch.setattr(_cursors, 'resource_close_async', resource_close_async)
+    return closed
+
+
+def patch_get_page(monkeypatch, get_page):
+    async def sql_fields_cursor_get_page_rows_async(conn, cursor_id, field_count):
+        return await get_page()
+
+    monkeypatch.setattr(_cursors, '_sql_fields_cursor_get_page_rows_async', sql_fields_cursor_get_page_rows_async)
+
+
+@pytest.mark.asyncio
+async def test_close_with_pending_prefetch(monkeypatch, closed_cursors):
+    requested = asyncio.Event()
+
+    async def get_page():
+        requested.set()
+        await asyncio.Event().wait()
+
+    patch_get_page(monkeypatch, get_page)
+
+    async with AioSqlFieldsCursor(FakeClient(), None, 'SELECT') as cursor:
+        assert await cursor.__anext__() == [1]
+        next_page = cursor._next_page
+        await requested.wait()
+
+    await asyncio.sleep(0)
+    assert next_page.cancelled()
+    assert closed_cursors == [42]
+
+
+@pytest.mark.asyncio
+async def test_close_with_failed_prefetch(monkeypatch, closed_cursors):
+    async def get_page():
+        raise SocketError('Connection broken.')
+
+    patch_get_page(monkeypatch, get_page)
+
+    async with AioSqlFieldsCursor(FakeClient(), None, 'SELECT'):
+        await asyncio.sleep(0)
+
+    assert closed_cursors == [42]
+
+
+@pytest.mark.asyncio
+async def test_close_with_last_page_prefetched(monkeypatch, closed_cursors):
+    async def get_page():
+        return page([[3]], False)
+
+    patch_get_page(monkeypatch, get_page)
+
+    async with AioSqlFieldsCursor(FakeClient(), None, 'SELECT'):
+        await asyncio.sleep(0)
+
+    assert closed_cursors == []
+
+
+@pytest.mark.asyncio
+async def test_dropped_cursor_with_failed_prefetch(monkeypatch, closed_cursors):
+    async def get_page():
+        raise SocketError('Connection broken.')
+
+    patch_get_page(monkeypatch, get_page)
+
+    loop, errors = asyncio.get_event_loop(), []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+    try:
+        cursor = await AioSqlFieldsCursor(FakeClient(), None, 'SELECT')
+        assert await cursor.__anext__() == [1]
+        await asyncio.sleep(0)
+        del cursor
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert errors == []
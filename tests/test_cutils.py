@@ -15,6 +15,7 @@
 
 import random
 from collections import OrderedDict
+from enum import Enum
 
 import pytest
 
@@ -26,9 +27,11 @@ try:
 
     _cutils_hashcode = _cutils.hashcode
     _cutils_schema_id = _cutils.schema_id
+    _cutils_entity_id = _cutils.entity_id
 except ImportError:
     _cutils_hashcode = lambda x: None  # noqa: E731
     _cutils_schema_id = lambda x: None  # noqa: E731
+    _cutils_entity_id = lambda x: None  # noqa: E731
     pass
 
 
@@ -84,6 +87,31 @@ def test_schema_id():
         assert _cutils_schema_id(schema) == _putils.__schema_id_fallback(schema), f'failed on {schema}'
 
 
+@pytest.mark.skip_if_no_cext
+def test_entity_id():
+    rnd_id = random.randint(-100, 100)
+    assert _cutils_entity_id(rnd_id) == rnd_id
+    assert _cutils_entity_id(None) is None
+    assert _cutils_entity_id('') == 0
+
+    for i in range(1000):
+        field_name = get_random_field_name(20)
+        assert _cutils_entity_id(field_name) == _putils.__entity_id_fallback(field_name), f'failed on {field_name}'
+
+    for name in ['İx', 'ΣΑΣ', 'Straße', 'ǅungla', 'ÀÉÎÕÜ', 'Кэш', '\U00010400']:
+        assert _cutils_entity_id(name) == _putils.__entity_id_fallback(name), f'failed on {name}'
+
+    class TypeName(str):
+        pass
+
+    class FieldName(str, Enum):
+        ID = 'Id'
+        NAME = 'ΣΑΣ'
+
+    for name in [TypeName('MyType'), TypeName('İx'), FieldName.ID, FieldName.NAME]:
+        assert _cutils_entity_id(name) == _putils.__entity_id_fallback(name), f'failed on {name!r}'
+
+
 @pytest.mark.skip_if_no_cext
 @pytest.mark.parametrize(
     'func,args,kwargs,err_cls',
@@ -98,6 +126,9 @@ def test_schema_id():
         [_cutils_schema_id, [], {}, TypeError],
         [_cutils_schema_id, [123, 123], {}, TypeError],
         [_cutils_schema_id, [], {'input': 'test'}, TypeError],
+        [_cutils_entity_id, [b'test'], {}, ValueError],
+        [_cutils_entity_id, [], {}, TypeError],
+        [_cutils_entity_id, [123, 123], {}, TypeError],
     ]
 )
 def test_handling_errors(func, args, kwargs, err_cls):
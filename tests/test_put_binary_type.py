@@ -0,0 +1,101 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+
+import pytest
+
+from pyignite.api.binary import put_binary_type
+from pyignite.connection import Connection
+from pyignite.connection.bitmask_feature import BitmaskFeature
+from pyignite.connection.protocol_context import ProtocolContext
+from pyignite.datatypes import IntObject, String
+
+
+class FakeClient:
+    compact_footer = True
+
+    def __init__(self):
+        self.protocol_context = ProtocolContext((1, 7, 0), BitmaskFeature.all_supported())
+
+
+class FakeConnection(Connection):
+    """ Connection that answers every request with an empty success response. """
+    def __init__(self):
+        super().__init__(FakeClient(), '127.0.0.1', 10800)
+        self.requests = []
+
+    def request(self, data, flags=None):
+        self.requests.append(bytes(data))
+        payload = bytes(data[6:14]) + struct.pack('<h', 0)
+        return struct.pack('<i', len(payload)) + payload
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection()
+
+
+def test_put_binary_type_once(conn):
+    schema = {'id': IntObject, 'name': String}
+
+    first = put_binary_type(conn, 'TestType', schema=schema)
+    second = put_binary_type(conn, 'TestType', schema=dict(schema))
+
+    assert len(conn.requests) == 1
+    assert first.status == second.status == 0
+    assert first.value == second.value
+    assert first is not second
+
+    second.value['type_id'] = 0
+    assert put_binary_type(conn, 'TestType', schema=schema).value == first.value
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'type_name': 'OtherType', 'schema': {'id': IntObject, 'name': String}},
+        {'type_name': 'TestType', 'schema': {'id': IntObject, 'name': IntObject}},
+        {'type_name': 'TestType', 'schema': {'id': IntObject, 'name': String}, 'affinity_key_field': 'id'},
+    ]
+)
+def test_put_binary_type_changed(conn, kwargs):
+    put_binary_type(conn, 'TestType', schema={'id': IntObject, 'name': String})
+    put_binary_type(conn, **kwargs)
+
+    assert len(conn.requests) == 2
+
+
+def test_put_binary_type_after_reconnect(conn):
+    schema = {'id': IntObject}
+
+    put_binary_type(conn, 'TestType', schema=schema)
+    conn._registered_types.clear()
+    put_binary_type(conn, 'TestType', schema=schema)
+
+    assert len(conn.requests) == 2
+
+
+def test_put_binary_type_unhashable_data_type(conn):
+    class UnhashableType:
+        __hash__ = None
+        type_code = IntObject.type_code
+
+    schema = {'id': UnhashableType()}
+
+    put_binary_type(conn, 'TestType', schema=schema)
+    put_binary_type(conn, 'TestType', schema=schema)
+
+    assert len(conn.requests) == 1
@@ -0,0 +1,98 @@
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+
+import pytest
+
+from pyignite.api.cache_config import cache_create_with_config
+from pyignite.api.sql import _sql_fields_cursor_get_page_rows, sql_fields_cursor_get_page
+from pyignite.connection import Connection
+from pyignite.connection.bitmask_feature import BitmaskFeature
+from pyignite.connection.protocol_context import ProtocolContext
+from pyignite.datatypes import AnyDataObject, Bool, Int, Short
+from pyignite.queries import ConfigQuery, Query
+from pyignite.queries.op_codes import OP_CACHE_CREATE_WITH_CONFIGURATION
+from pyignite.stream import BinaryStream
+
+
+class FakeClient:
+    compact_footer = True
+
+    def __init__(self):
+        self.protocol_context = ProtocolContext((1, 7, 0), BitmaskFeature.all_supported())
+
+
+class FakeConnection(Connection):
+    """ Connection that answers every request with a success response with the given body. """
+    def __init__(self, body=b''):
+        super().__init__(FakeClient(), '127.0.0.1', 10800)
+        self.body = body
+        self.requests = []
+
+    def request(self, data, flags=None):
+        self.requests.append(bytes(data))
+        payload = bytes(data[6:14]) + struct.pack('<h', 0) + self.body
+        return struct.pack('<i', len(payload)) + payload
+
+
+def test_cache_create_with_empty_config():
+    conn = FakeConnection()
+
+    assert cache_create_with_config(conn, {}, query_id=42).status == 0
+    # length, op_code, query_id, config_length, param_count
+    assert conn.requests == [struct.pack('<ihqih', 16, OP_CACHE_CREATE_WITH_CONFIGURATION, 42, 2, 0)]
+
+
+@pytest.mark.parametrize('query_id', [None, 42])
+def test_primitive_query_layout(query_id):
+    following = [('cursor', Int), ('count', Short)]
+    values = (7, 3)
+
+    with BinaryStream(None) as stream:
+        Query(1, following, query_id=query_id).from_python(stream, values)
+        data = stream.getvalue()
+    assert data[:6] == struct.pack('<ih', 16, 1)
+    assert data[14:] == struct.pack('<ih', 7, 3)
+
+    generic = Query(1, following, query_id=query_id)
+    generic._fixed_struct = None
+    with BinaryStream(None) as stream:
+        generic.from_python(stream, values)
+        assert stream.getvalue()[:6] + stream.getvalue()[14:] == data[:6] + data[14:]
+
+    with BinaryStream(None) as stream:
+        ConfigQuery(1, following, query_id=query_id).from_python(stream, values)
+        data = stream.getvalue()
+    assert data[:6] == struct.pack('<ih', 20, 1)
+    assert data[14:] == struct.pack('<iih', 6, 7, 3)
+
+
+def test_sql_fields_cursor_page_rows():
+    with BinaryStream(None) as stream:
+        Int.from_python(stream, 2)
+        for value in (1, 'a', 2, 'b'):
+            AnyDataObject.from_python(stream, value)
+        Bool.from_python(stream, False)
+        body = stream.getvalue()
+    conn = FakeConnection(body)
+
+    result = sql_fields_cursor_get_page(conn, 1, 2)
+    assert result.value == {'data': [[1, 'a'], [2, 'b']], 'more': False}
+
+    result = _sql_fields_cursor_get_page_rows(conn, 1, 2)
+    assert not isinstance(result.value['data'], list)
+    assert list(result.value['data']) == [[1, 'a'], [2, 'b']]
+    assert result.value['more'] is False